@@ -0,0 +1,122 @@
+import numpy as np
+
+
+class AdaptiveControl:
+    # Retunes the genetic algorithm between generations from what the last one achieved.
+    #
+    # Operator mix: each child records the mutation operator it was made with and the fitness of its better
+    # parent. Once the child is evaluated, the operator is credited with the child's improvement over that parent.
+    # The operator's quality is an exponential average of those credits, and operators are picked in proportion to
+    # their quality, with a floor of min_probability so none is ever dropped for good.
+    #
+    # Mutation rate: the 1/5 success rule. When more than a fifth of the children beat their better parent the
+    # rate goes up, since bigger steps still pay off; when fewer do, mutations are mostly destructive and it goes
+    # down.
+    #
+    # Selection pressure: tournaments grow while the best fitness stalls and the population is still diverse,
+    # and shrink again when diversity falls below diversity_target so the population doesn't collapse onto one
+    # schedule.
+
+    def __init__(self, operators, mutation_rate, tournament_size, min_rate=0.002, max_rate=0.5, min_tournament=2,
+                 max_tournament=8, diversity_target=0.01, success_target=0.2, step=1.2, learning_rate=0.3,
+                 min_probability=0.1):
+        self.operators = tuple(operators)
+        self.mutation_rate = mutation_rate
+        self.tournament_size = tournament_size
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.min_tournament = min_tournament
+        self.max_tournament = max_tournament
+        self.diversity_target = diversity_target
+        self.success_target = success_target
+        self.step = step
+        self.learning_rate = learning_rate
+        self.min_probability = min(min_probability, 1 / len(self.operators))
+
+        self.quality = np.ones(len(self.operators))
+        self.uses = np.zeros(len(self.operators), dtype=np.int64)
+        self.successes = np.zeros(len(self.operators), dtype=np.int64)
+        self.best = None
+
+        # Children bred by the last generation, credited once they are evaluated
+        self.pending_operators = np.empty(0, dtype=np.int64)
+        self.pending_parent_fitness = np.empty(0)
+
+    def probabilities(self):
+        total = self.quality.sum()
+        share = self.quality / total if total > 0 else np.full(len(self.quality), 1 / len(self.quality))
+        return self.min_probability + (1 - len(self.quality) * self.min_probability) * share
+
+    def draw_operators(self, np_random, count):
+        if len(self.operators) == 1:
+            return np.zeros(count, dtype=np.int64)
+        return np_random.choice(len(self.operators), size=count, p=self.probabilities())
+
+    def record_offspring(self, operators, parent_fitness):
+        self.pending_operators = np.asarray(operators, dtype=np.int64)
+        self.pending_parent_fitness = np.asarray(parent_fitness, dtype=np.float64)
+
+    def update(self, fitness_scores, diversity):
+        # fitness_scores of the new population, whose last rows are the recorded children
+        success = None
+        if len(self.pending_operators):
+            children = fitness_scores[len(fitness_scores) - len(self.pending_operators):]
+            gain = np.clip(children - self.pending_parent_fitness, 0, None)
+            uses = np.bincount(self.pending_operators, minlength=len(self.operators))
+            credit = np.bincount(self.pending_operators, weights=gain, minlength=len(self.operators))
+            used = uses > 0
+            # Credits are relative to the best operator so the quality scale doesn't depend on the fitness scale
+            reward = np.where(used, credit / np.maximum(uses, 1), 0.0)
+            if reward.max() > 0:
+                reward /= reward.max()
+            self.quality[used] += self.learning_rate * (reward[used] - self.quality[used])
+            self.uses += uses
+            self.successes += np.bincount(self.pending_operators, weights=gain > 0,
+                                          minlength=len(self.operators)).astype(np.int64)
+            success = float((gain > 0).mean())
+            self.pending_operators = np.empty(0, dtype=np.int64)
+            self.pending_parent_fitness = np.empty(0)
+
+        if success is not None:
+            factor = self.step if success > self.success_target else 1 / self.step
+            self.mutation_rate = min(max(self.mutation_rate * factor, self.min_rate), self.max_rate)
+
+        best = float(fitness_scores.max())
+        improved = self.best is None or best > self.best
+        self.best = best if self.best is None else max(self.best, best)
+        if diversity < self.diversity_target:
+            self.tournament_size = max(self.tournament_size - 1, self.min_tournament)
+        elif not improved:
+            self.tournament_size = min(self.tournament_size + 1, self.max_tournament)
+
+    def get_state(self):
+        # JSON-friendly snapshot for checkpoints
+        return {
+            'operators': list(self.operators),
+            'mutation_rate': self.mutation_rate,
+            'tournament_size': self.tournament_size,
+            'quality': self.quality.tolist(),
+            'uses': self.uses.tolist(),
+            'successes': self.successes.tolist(),
+            'best': self.best,
+            'pending_operators': self.pending_operators.tolist(),
+            'pending_parent_fitness': self.pending_parent_fitness.tolist()
+        }
+
+    def set_state(self, state):
+        self.mutation_rate = state['mutation_rate']
+        self.tournament_size = state['tournament_size']
+        self.quality = np.array(state['quality'], dtype=np.float64)
+        self.uses = np.array(state['uses'], dtype=np.int64)
+        self.successes = np.array(state['successes'], dtype=np.int64)
+        self.best = state['best']
+        self.record_offspring(state['pending_operators'], state['pending_parent_fitness'])
+
+    def stats(self):
+        return {
+            'mutation_rate': self.mutation_rate,
+            'tournament_size': self.tournament_size,
+            'operators': {name: {'probability': float(p), 'uses': int(uses), 'successes': int(successes)}
+                          for name, p, uses, successes in zip(self.operators, self.probabilities(), self.uses,
+                                                              self.successes)}
+        }
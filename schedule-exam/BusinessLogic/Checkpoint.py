@@ -0,0 +1,43 @@
+import json
+import os
+import zipfile
+
+import numpy as np
+
+CHECKPOINT_VERSION = 2
+
+
+class CheckpointError(ValueError):
+    # A checkpoint can't be written, read or resumed from
+    pass
+
+
+def save_checkpoint(filename, arrays, meta):
+    # A compressed .npz archive: numpy arrays as-is, everything else as one JSON document (RNG states hold
+    # 128-bit integers, which JSON keeps exactly). Nothing is pickled, so loading a checkpoint can't run code.
+    # The file is written next to the target and renamed over it, so a crash never leaves a torn checkpoint.
+    tmp = f"{filename}.tmp"
+    try:
+        with open(tmp, 'wb') as f:
+            np.savez_compressed(f, meta=np.array(json.dumps(dict(meta, version=CHECKPOINT_VERSION))), **arrays)
+        os.replace(tmp, filename)
+    except OSError as e:
+        raise CheckpointError(f"Cannot write {filename}: {e}") from e
+
+
+def load_checkpoint(filename):
+    # Returns (arrays, meta); raises CheckpointError for unreadable files and files that aren't checkpoints of
+    # this version
+    try:
+        with np.load(filename, allow_pickle=False) as archive:
+            arrays = {name: archive[name] for name in archive.files}
+    except OSError as e:
+        raise CheckpointError(f"Cannot read {filename}: {e}") from e
+    except (ValueError, zipfile.BadZipFile):
+        raise CheckpointError(f"{filename} is not a checkpoint file") from None
+    if 'meta' not in arrays:
+        raise CheckpointError(f"{filename} is not a checkpoint file")
+    meta = json.loads(str(arrays.pop('meta')))
+    if meta.get('version') != CHECKPOINT_VERSION:
+        raise CheckpointError(f"Unsupported checkpoint version: {meta.get('version')}")
+    return arrays, meta
@@ -0,0 +1,51 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+class FitnessCache:
+    # Bounded LRU cache of fitness scores keyed by chromosome content. Elites and duplicate offspring are
+    # looked up instead of re-evaluated. Only the parent process touches it, so it's safe with a worker pool.
+
+    def __init__(self, maxsize=10000):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def fingerprint(chromosome):
+        # Slot order inside an exam row doesn't change the schedule, so rows are sorted before hashing;
+        # a 128-bit digest keeps entries small however large the chromosome is
+        return hashlib.blake2b(np.sort(chromosome, axis=1).tobytes(), digest_size=16).digest()
+
+    def get(self, key):
+        score = self.entries.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def put(self, key, score):
+        self.entries[key] = score
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.entries),
+            'maxsize': self.maxsize
+        }
@@ -0,0 +1,159 @@
+import math
+
+import numpy as np
+
+from BusinessLogic.ProblemInstance import EMPTY_SLOT
+
+
+def count_conflicts(problem, population, pairs=None):
+    # Double bookings per chromosome (or for a single chromosome): a teacher on both exams of an overlapping
+    # pair counts once per pair. Works on the precomputed pairs (or the given subset of them), so the cost is
+    # linear in their number.
+    pairs = problem.conflict_pairs if pairs is None else pairs
+    first, second = pairs[:, 0], pairs[:, 1]
+    rows, other = population[..., first, :, None], population[..., second, None, :]
+    return ((rows == other) & (rows != EMPTY_SLOT)).sum(axis=(-3, -2, -1))
+
+
+class FitnessState:
+    # Cached aggregates of one chromosome, kept in sync gene by gene so the fitness score can be
+    # updated in O(changed genes) instead of rescanning every exam and teacher. Double bookings are counted
+    # against the chromosome itself, which callers pass along with each change.
+
+    def __init__(self, problem, chromosome):
+        self.problem = problem
+        self.reset(chromosome)
+
+    def reset(self, chromosome):
+        # Full rebuild from a chromosome; cheaper than delta updates when most genes changed
+        problem = self.problem
+        assigned = chromosome != EMPTY_SLOT
+        exam_idx, _ = np.nonzero(assigned)
+        teacher_idx = chromosome[assigned].astype(np.int64)
+
+        # Per-exam staffing and the total understaffing deficit
+        self.staffed = assigned.sum(axis=1).astype(np.int64)
+        self.understaffing = int(np.clip(problem.supervisors_needed - self.staffed, 0, None).sum())
+
+        # Per-teacher-per-week counts and the total weekly over-capacity
+        self.weekly = np.zeros((len(problem.teachers), len(problem.weeks)), dtype=np.int64)
+        np.add.at(self.weekly, (teacher_idx, problem.exam_weeks[exam_idx]), 1)
+        self.over_capacity = int(np.clip(self.weekly - problem.capacities[:, None], 0, None).sum())
+
+        # Number of (teacher, overlapping exam pair) double bookings
+        self.conflicts = int(count_conflicts(problem, chromosome))
+
+        # Per-teacher totals with running sum / sum of squares for the std-dev term
+        self.totals = np.bincount(teacher_idx, minlength=len(problem.teachers)).astype(np.int64)
+        self.total_sum = int(self.totals.sum())
+        self.total_sum_squares = int((self.totals ** 2).sum())
+
+    def copy(self):
+        state = FitnessState.__new__(FitnessState)
+        state.problem = self.problem
+        state.staffed = self.staffed.copy()
+        state.understaffing = self.understaffing
+        state.weekly = self.weekly.copy()
+        state.over_capacity = self.over_capacity
+        state.conflicts = self.conflicts
+        state.totals = self.totals.copy()
+        state.total_sum = self.total_sum
+        state.total_sum_squares = self.total_sum_squares
+        return state
+
+    def add(self, exam, teacher, chromosome):
+        # chromosome must be current for every exam but `exam`, whose row may or may not hold the teacher yet
+        problem = self.problem
+        if self.staffed[exam] < problem.supervisors_needed[exam]:
+            self.understaffing -= 1
+        self.staffed[exam] += 1
+
+        week = problem.exam_weeks[exam]
+        self.weekly[teacher, week] += 1
+        if self.weekly[teacher, week] > problem.capacities[teacher]:
+            self.over_capacity += 1
+
+        self.conflicts += int((chromosome[problem.conflicts[exam]] == teacher).sum())
+
+        self.total_sum += 1
+        self.total_sum_squares += 2 * int(self.totals[teacher]) + 1
+        self.totals[teacher] += 1
+
+    def remove(self, exam, teacher, chromosome):
+        problem = self.problem
+        self.staffed[exam] -= 1
+        if self.staffed[exam] < problem.supervisors_needed[exam]:
+            self.understaffing += 1
+
+        week = problem.exam_weeks[exam]
+        if self.weekly[teacher, week] > problem.capacities[teacher]:
+            self.over_capacity -= 1
+        self.weekly[teacher, week] -= 1
+
+        self.conflicts -= int((chromosome[problem.conflicts[exam]] == teacher).sum())
+
+        self.totals[teacher] -= 1
+        self.total_sum -= 1
+        self.total_sum_squares -= 2 * int(self.totals[teacher]) + 1
+
+    def replace_rows(self, exams, old_chromosome, new_chromosome):
+        # Swap the supervisor rows of several exams at once, touching only the teachers that actually change.
+        # old_chromosome is the one this state describes; new_chromosome differs from it in those rows only.
+        old_rows, new_rows = old_chromosome[exams], new_chromosome[exams]
+        in_new = (old_rows[:, :, None] == new_rows[:, None, :]).any(axis=2)
+        in_old = (new_rows[:, :, None] == old_rows[:, None, :]).any(axis=2)
+        removed = (old_rows != EMPTY_SLOT) & ~in_new
+        added = (new_rows != EMPTY_SLOT) & ~in_old
+
+        exam_idx = np.concatenate([np.broadcast_to(exams[:, None], removed.shape)[removed],
+                                   np.broadcast_to(exams[:, None], added.shape)[added]])
+        teacher_idx = np.concatenate([old_rows[removed], new_rows[added]]).astype(np.int64)
+        delta = np.concatenate([np.full(removed.sum(), -1), np.ones(added.sum(), dtype=np.int64)])
+        if len(delta):
+            self.apply(exam_idx, teacher_idx, delta)
+
+        # Double bookings can only change on the overlapping pairs that involve a replaced row
+        replaced = np.zeros(len(self.staffed), dtype=bool)
+        replaced[exams] = True
+        pairs = self.problem.conflict_pairs
+        pairs = pairs[replaced[pairs[:, 0]] | replaced[pairs[:, 1]]]
+        if len(pairs):
+            self.conflicts += int(count_conflicts(self.problem, new_chromosome, pairs) -
+                                  count_conflicts(self.problem, old_chromosome, pairs))
+
+    def apply(self, exam_idx, teacher_idx, delta):
+        # Vectorized add (+1) / remove (-1) of (exam, teacher) genes; only the touched cells are rescored.
+        # Double bookings are left to replace_rows, which has both chromosomes at hand.
+        problem = self.problem
+        n_teachers, n_weeks = self.weekly.shape
+
+        staffed_delta = np.bincount(exam_idx, weights=delta, minlength=len(self.staffed)).astype(np.int64)
+        exams = np.flatnonzero(staffed_delta)
+        needed = problem.supervisors_needed[exams]
+        self.understaffing -= int(np.clip(needed - self.staffed[exams], 0, None).sum())
+        self.staffed[exams] += staffed_delta[exams]
+        self.understaffing += int(np.clip(needed - self.staffed[exams], 0, None).sum())
+
+        cell_idx = teacher_idx * n_weeks + problem.exam_weeks[exam_idx]
+        weekly_delta = np.bincount(cell_idx, weights=delta, minlength=n_teachers * n_weeks).astype(np.int64)
+        cells = np.flatnonzero(weekly_delta)
+        weekly = self.weekly.reshape(-1)
+        capacity = problem.capacities[cells // n_weeks]
+        self.over_capacity -= int(np.clip(weekly[cells] - capacity, 0, None).sum())
+        weekly[cells] += weekly_delta[cells]
+        self.over_capacity += int(np.clip(weekly[cells] - capacity, 0, None).sum())
+
+        totals_delta = np.bincount(teacher_idx, weights=delta, minlength=n_teachers).astype(np.int64)
+        teachers = np.flatnonzero(totals_delta)
+        self.total_sum_squares -= int((self.totals[teachers] ** 2).sum())
+        self.totals[teachers] += totals_delta[teachers]
+        self.total_sum_squares += int((self.totals[teachers] ** 2).sum())
+        self.total_sum += int(totals_delta.sum())
+
+    def score(self):
+        # Same penalties as GeneticAlgorithm.fitness; the variance comes from exact integer sums
+        n_teachers = len(self.totals)
+        std_dev = 0.0
+        if n_teachers:
+            std_dev = math.sqrt(max(n_teachers * self.total_sum_squares - self.total_sum ** 2, 0)) / n_teachers
+        return -100 * self.understaffing - 50 * self.over_capacity - 100 * self.conflicts - 20 * std_dev
@@ -0,0 +1,208 @@
+import time
+
+import numpy as np
+
+from BusinessLogic.FitnessState import FitnessState
+from BusinessLogic.ProblemInstance import EMPTY_SLOT, ProblemInstance
+
+
+class FlowSolver:
+    # Exact solver for the hard constraints, written as a flow problem:
+    #   source -> exam (supervisors_needed) -> teacher-week (1 per eligible teacher) -> sink (weekly capacity)
+    # Assignments are kept in an (exams, teachers) boolean matrix; augmenting paths alternate between adding a
+    # teacher to an exam and taking them off another exam of the same week, and are searched breadth-first with
+    # one vectorized step per layer.
+    #
+    # 1. Staffing: augment from understaffed exams until no path is left, i.e. a maximum flow.
+    # 2. Balance: move supervisions along paths from a teacher with total L to one with total <= L - 2 until
+    #    none is left, which minimizes the sum of squared totals (and so their std) for that flow.
+    # 3. Exams still understaffed get the least-loaded remaining teachers over capacity, since the fitness
+    #    function penalizes a missing supervisor twice as much as one extra supervision.
+    #
+    # Overlapping exams aren't a flow constraint: a teacher already on an exam overlapping e (counted in `busy`)
+    # is never added to e, which keeps schedules free of double bookings but makes steps 1-2 exact only for the
+    # remaining choices.
+
+    def __init__(self, teachers, exams, seed=None):
+        self.teachers = teachers
+        self.exams = exams
+        self.np_random = np.random.default_rng(seed)
+        self.problem = ProblemInstance(teachers, exams)
+        self.slots = self.problem.slots
+        self.generations = 1
+
+        self.augmentations = 0
+        self.balancing_moves = 0
+
+    def initial_assignment(self):
+        # Least-loaded-first greedy start in date order; the augmenting paths only fix what it couldn't place
+        problem = self.problem
+        assigned = np.zeros((len(problem.exams), len(problem.teachers)), dtype=bool)
+        load = np.zeros((len(problem.teachers), len(problem.weeks)), dtype=np.int64)
+        totals = np.zeros(len(problem.teachers), dtype=np.int64)
+        # busy[e, t]: number of exams overlapping e that t supervises
+        busy = np.zeros((len(problem.exams), len(problem.teachers)), dtype=np.int64)
+
+        for e in problem.date_order:
+            candidates = problem.eligible_teachers[e]
+            week = problem.exam_weeks[e]
+            candidates = candidates[(load[candidates, week] < problem.capacities[candidates]) &
+                                    (busy[e, candidates] == 0)]
+            order = np.lexsort((self.np_random.random(len(candidates)), totals[candidates]))
+            chosen = candidates[order[:problem.supervisors_needed[e]]]
+            assigned[e, chosen] = True
+            load[chosen, week] += 1
+            totals[chosen] += 1
+            busy[np.ix_(problem.conflicts[e], chosen)] += 1
+        return assigned, load, totals, busy
+
+    def find_path(self, assigned, busy, totals, sink_mask, source_exams=None, source_teacher=None):
+        # Breadth-first search for an augmenting path ending at a teacher-week node in sink_mask, starting either
+        # from source_exams (gaining a supervisor) or from every week of source_teacher (losing a supervision).
+        # Returns the path as a list of (exam, teacher, added) steps, or None.
+        problem = self.problem
+        n_weeks = len(problem.weeks)
+        eligible = problem.eligibility.T
+        exam_parent = np.full(len(problem.exams), -2, dtype=np.int64)
+        node_parent = np.full(len(problem.teachers) * n_weeks, -2, dtype=np.int64)
+
+        if source_exams is not None:
+            frontier = source_exams
+            exam_parent[frontier] = -1
+        else:
+            nodes = source_teacher * n_weeks + np.arange(n_weeks)
+            node_parent[nodes] = -1
+            frontier = self.exams_of_nodes(assigned, nodes, exam_parent)
+
+        while len(frontier):
+            # Exams -> teacher-weeks: teachers that could be added to a frontier exam
+            exam_pos, teacher_idx = np.nonzero(eligible[frontier] & ~assigned[frontier] & (busy[frontier] == 0))
+            nodes = teacher_idx * n_weeks + problem.exam_weeks[frontier[exam_pos]]
+            fresh = node_parent[nodes] == -2
+            nodes, first = np.unique(nodes[fresh], return_index=True)
+            node_parent[nodes] = frontier[exam_pos[fresh][first]]
+
+            sinks = nodes[sink_mask[nodes]]
+            if len(sinks):
+                # Prefer ending at the least-loaded teacher
+                return self.trace_path(sinks[np.argmin(totals[sinks // n_weeks])], exam_parent, node_parent)
+
+            # Teacher-weeks -> exams: exams of that week the teacher could be taken off
+            frontier = self.exams_of_nodes(assigned, nodes, exam_parent)
+        return None
+
+    def exams_of_nodes(self, assigned, nodes, exam_parent):
+        # Unvisited exams held by the given teacher-week nodes; records each exam's parent node
+        problem = self.problem
+        n_weeks = len(problem.weeks)
+        exam_idx, node_pos = np.nonzero(assigned[:, nodes // n_weeks] &
+                                        (problem.exam_weeks[:, None] == nodes % n_weeks))
+        fresh = exam_parent[exam_idx] == -2
+        exam_idx, first = np.unique(exam_idx[fresh], return_index=True)
+        exam_parent[exam_idx] = nodes[node_pos[fresh][first]]
+        return exam_idx
+
+    def trace_path(self, sink, exam_parent, node_parent):
+        n_weeks = len(self.problem.weeks)
+        path = []
+        node = sink
+        while True:
+            exam = node_parent[node]
+            path.append((exam, node // n_weeks, True))
+            node = exam_parent[exam]
+            if node == -1:
+                return path
+            path.append((exam, node // n_weeks, False))
+            if node_parent[node] == -1:
+                return path
+
+    def augment(self, path, assigned, load, totals, busy):
+        problem = self.problem
+        for exam, teacher, added in path:
+            assigned[exam, teacher] = added
+            step = 1 if added else -1
+            load[teacher, problem.exam_weeks[exam]] += step
+            totals[teacher] += step
+            busy[problem.conflicts[exam], teacher] += step
+
+    def maximize_staffing(self, assigned, load, totals, busy, should_stop=None):
+        problem = self.problem
+        while should_stop is None or not should_stop():
+            understaffed = np.flatnonzero(assigned.sum(axis=1) < problem.supervisors_needed)
+            if len(understaffed) == 0:
+                return
+            spare = (load < problem.capacities[:, None]).reshape(-1)
+            path = self.find_path(assigned, busy, totals, spare, source_exams=understaffed)
+            if path is None:
+                return
+            self.augment(path, assigned, load, totals, busy)
+            self.augmentations += 1
+
+    def balance(self, assigned, load, totals, busy, should_stop=None):
+        problem = self.problem
+        n_weeks = len(problem.weeks)
+        while should_stop is None or not should_stop():
+            spare = (load < problem.capacities[:, None]).reshape(-1)
+            node_totals = np.repeat(totals, n_weeks)
+            moved = False
+            # Heaviest teachers first; any path to a teacher two or more supervisions lighter is an improvement
+            for teacher in np.argsort(-totals, kind='stable'):
+                sink_mask = spare & (node_totals <= totals[teacher] - 2)
+                if not sink_mask.any():
+                    break
+                path = self.find_path(assigned, busy, totals, sink_mask, source_teacher=teacher)
+                if path is not None:
+                    self.augment(path, assigned, load, totals, busy)
+                    self.balancing_moves += 1
+                    moved = True
+                    break
+            if not moved:
+                return
+
+    def fill_understaffed(self, assigned, load, totals, busy):
+        # A double booking costs as much as the missing supervisor, so only teachers free at that time are used
+        problem = self.problem
+        for e in np.flatnonzero(assigned.sum(axis=1) < problem.supervisors_needed):
+            candidates = problem.eligible_teachers[e]
+            candidates = candidates[~assigned[e, candidates] & (busy[e, candidates] == 0)]
+            chosen = candidates[np.argsort(totals[candidates], kind='stable')]
+            chosen = chosen[:problem.supervisors_needed[e] - assigned[e].sum()]
+            assigned[e, chosen] = True
+            load[chosen, problem.exam_weeks[e]] += 1
+            totals[chosen] += 1
+            busy[np.ix_(problem.conflicts[e], chosen)] += 1
+
+    def solve_chromosome(self, should_stop=None):
+        assigned, load, totals, busy = self.initial_assignment()
+        self.maximize_staffing(assigned, load, totals, busy, should_stop)
+        self.balance(assigned, load, totals, busy, should_stop)
+        self.fill_understaffed(assigned, load, totals, busy)
+        # Exams x teachers assignment matrix -> chromosome
+        chromosome = np.full((len(self.problem.exams), self.slots), EMPTY_SLOT, dtype=np.int32)
+        for e, row in enumerate(assigned):
+            teachers = np.flatnonzero(row)
+            chromosome[e, :len(teachers)] = teachers
+        return chromosome
+
+    def solve(self, progress_callback=None, should_stop=None):
+        # Same (solution, report) result as GeneticAlgorithm.solve
+        start = time.perf_counter()
+        chromosome = self.solve_chromosome(should_stop)
+        fitness = FitnessState(self.problem, chromosome).score()
+        cancelled = should_stop is not None and should_stop()
+        if progress_callback is not None:
+            progress_callback(0, fitness, fitness)
+
+        report = {
+            'solver': 'flow',
+            'generations': 0,
+            'stop_reason': 'cancelled' if cancelled else 'optimal',
+            'best_fitness': float(fitness),
+            'best_fitness_history': [float(fitness)],
+            'generation_times': [],
+            'elapsed': time.perf_counter() - start,
+            'cache': None,
+            'augmentations': self.augmentations,
+            'balancing_moves': self.balancing_moves
+        }
+        return self.problem.decode(chromosome), report
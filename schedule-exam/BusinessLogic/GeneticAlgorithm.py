@@ -1,157 +1,833 @@
-import random
+import hashlib
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+
 import numpy as np
 
+from BusinessLogic.AdaptiveControl import AdaptiveControl
+from BusinessLogic.Checkpoint import CheckpointError, load_checkpoint, save_checkpoint
+from BusinessLogic.FitnessCache import FitnessCache
+from BusinessLogic.FitnessState import FitnessState, count_conflicts
+from BusinessLogic.LocalSearch import LocalSearch
+from BusinessLogic.ProblemInstance import EMPTY_SLOT, ProblemInstance
+
+# Above this fraction of swapped exam rows, rebuilding a child's FitnessState beats delta updates
+DELTA_ROW_LIMIT = 0.1
+
+# Mutation operators applied to each mutated exam:
+#   add_remove: add a random teacher to a free slot or drop one of the exam's teachers
+#   swap: exchange one of the exam's teachers with a teacher of another exam
+#   move: move one of the exam's teachers onto another exam with a free slot, understaffed ones first
+MUTATION_OPERATORS = ('add_remove', 'swap', 'move')
+
+
+def print_progress(generation, best_fitness, avg_fitness):
+    print(f"Generation {generation}: Best Fitness = {best_fitness}, Avg Fitness = {avg_fitness}")
+
+
+# Per-process engine used by pool workers, built once by _init_worker
+_worker_ga = None
+
+
+def _init_worker(teachers, exams, mutation_operators, repair):
+    # Runs once in every worker process: static teacher/exam data crosses the process boundary only here
+    global _worker_ga
+    _worker_ga = GeneticAlgorithm(teachers, exams, repair=repair, mutation_operators=mutation_operators)
+
+
+def _evaluate_chunk(population):
+    return _worker_ga.fitness_batch(population)
+
+
+def _breed_chunk(children, mutated, seeds, operators):
+    # Mutates (and repairs) crossed-over children with the masks drawn by the parent process. Each child gets its
+    # own seed for the teacher picks, so the offspring don't depend on how work is split between workers.
+    for i, seed in enumerate(seeds):
+        _worker_ga.np_random = np.random.default_rng(seed)
+        if mutated[i].any():
+            _worker_ga.mutate(children[i], operator=operators[i], mutated=mutated[i])
+        if _worker_ga.repair_offspring:
+            _worker_ga.repair(children[i])
+    return children
+
+
 class GeneticAlgorithm:
-    def __init__(self, teachers, exams, population_size=50, generations=100, mutation_rate=0.1, elite_size=5):
+    def __init__(self, teachers, exams, population_size=50, generations=100, mutation_rate=0.1, elite_size=5,
+                 seed=None, workers=1, parallel_offspring=False, incremental=False, stagnation_generations=None,
+                 target_fitness=None, time_budget=None, diversity_floor=None, instrumentation=None,
+                 cache_size=10000, repair=False, seed_fraction=0.0, initial_chromosomes=None,
+                 polish_count=0, polish_iterations=1000, polish_time=None, checkpoint_path=None,
+                 checkpoint_every=10, resume_from=None, tournament_size=3, adaptive=False, mutation_operators=None):
         self.teachers = teachers
         self.exams = exams
         self.population_size = population_size
         self.generations = generations
         self.mutation_rate = mutation_rate
         self.elite_size = elite_size
+        self.tournament_size = tournament_size
+
+        # Mutation operators in use (see MUTATION_OPERATORS); all of them by default in adaptive runs,
+        # add_remove only otherwise. A fixed mix picks uniformly between them.
+        if mutation_operators is None:
+            mutation_operators = MUTATION_OPERATORS if adaptive else ('add_remove',)
+        unknown = set(mutation_operators) - set(MUTATION_OPERATORS)
+        if unknown:
+            raise ValueError(f"Unknown mutation operators: {', '.join(sorted(unknown))}")
+        self.mutation_operators = tuple(mutation_operators)
+
+        # Adaptive runs retune mutation_rate, tournament_size and the operator mix every generation
+        self.control = AdaptiveControl(self.mutation_operators, mutation_rate, tournament_size) if adaptive else None
+
+        # Process pool settings: with workers > 1 fitness evaluation (and optionally offspring creation)
+        # is spread over a concurrent.futures process pool
+        self.workers = workers
+        self.parallel_offspring = parallel_offspring
+
+        # Score offspring from their parents' cached FitnessState instead of a full rescan
+        self.incremental = incremental
+
+        # Early stopping criteria, each disabled when None:
+        # no best-fitness improvement for stagnation_generations generations, best fitness reaching
+        # target_fitness, time_budget seconds of wall-clock time, population diversity below diversity_floor
+        self.stagnation_generations = stagnation_generations
+        self.target_fitness = target_fitness
+        self.time_budget = time_budget
+        self.diversity_floor = diversity_floor
+
+        # Optional Instrumentation receiving per-generation timers, counters and population statistics
+        self.instrumentation = instrumentation
+
+        # LRU cache of fitness scores by chromosome content (disabled with cache_size=0)
+        self.fitness_cache = FitnessCache(cache_size) if cache_size else None
+
+        # Run the capacity repair operator on every child after mutation
+        self.repair_offspring = repair
+
+        # Fraction of the initial population built by the greedy heuristic instead of at random
+        self.seed_fraction = seed_fraction
+        # Encoded chromosomes placed as-is at the front of the initial population (e.g. another solver's result)
+        self.initial_chromosomes = [] if initial_chromosomes is None else list(initial_chromosomes)
+
+        # Local search on the polish_count best chromosomes of the final population, each limited to
+        # polish_iterations tries and (when set) an equal share of polish_time seconds
+        self.polish_count = polish_count
+        self.polish_iterations = polish_iterations
+        self.polish_time = polish_time
+
+        # Save the run state to checkpoint_path every checkpoint_every generations and when the run ends;
+        # resume_from continues a saved run, with these settings or different ones (a fork)
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.resume_from = resume_from
+
+        # Every random draw of the run comes from this one generator, so a seed fixes the whole run
+        self.np_random = np.random.default_rng(seed)
+
+        # Static lookups shared by every operator, derived once per run
+        self.problem = ProblemInstance(teachers, exams)
+
+        # Chromosomes are rows of an int array: one row per exam, one column per supervisor slot,
+        # holding teacher indices (positions in self.teachers) or EMPTY_SLOT
+        self.slots = self.problem.slots
+
+    def weekly_load(self, chromosome):
+        # (teachers, weeks) supervision counts of one chromosome
+        problem = self.problem
+        assigned = chromosome != EMPTY_SLOT
+        exam_idx, _ = np.nonzero(assigned)
+        cells = chromosome[assigned].astype(np.int64) * len(problem.weeks) + problem.exam_weeks[exam_idx]
+        load = np.bincount(cells, minlength=len(problem.teachers) * len(problem.weeks))
+        return load.reshape(len(problem.teachers), len(problem.weeks))
+
+    def busy_teachers(self, chromosome, exam):
+        # Teachers the chromosome already assigns to an exam overlapping this one
+        busy = chromosome[self.problem.conflicts[exam]].reshape(-1)
+        return busy[busy != EMPTY_SLOT]
+
+    def available_mask(self, exam, candidates, load, chromosome):
+        # Which candidate teachers (indices, already eligible for the exam) are still under their weekly capacity
+        # in `load` and not on an overlapping exam in `chromosome`; the one availability rule of every operator
+        self.count('eligibility_lookups')
+        problem = self.problem
+        return ((load[candidates, problem.exam_weeks[exam]] < problem.capacities[candidates]) &
+                np.isin(candidates, self.busy_teachers(chromosome, exam), invert=True))
+
+    def pick_teachers(self, exam, count, load, chromosome):
+        # Up to `count` random eligible teachers for an exam not already on it, drawn first from those still under
+        # their weekly capacity in `load` and free at that time in `chromosome`; other teachers are only used when
+        # no feasible choice is left
+        candidates = self.problem.eligible_teachers[exam]
+        candidates = candidates[np.isin(candidates, chromosome[exam], invert=True)]
+
+        feasible_mask = self.available_mask(exam, candidates, load, chromosome)
+        feasible, infeasible = candidates[feasible_mask], candidates[~feasible_mask]
+        chosen = self.np_random.choice(feasible, min(count, len(feasible)), replace=False)
+        if len(chosen) < count and len(infeasible):
+            extra = self.np_random.choice(infeasible, min(count - len(chosen), len(infeasible)), replace=False)
+            chosen = np.concatenate([chosen, extra])
+        return chosen
+
+    def greedy_chromosome(self):
+        # Least-loaded-first construction: exams in date order, each taking the eligible teachers with the fewest
+        # supervisions so far, those with weekly capacity left and no overlapping exam first. Ties are broken at
+        # random so repeated calls give different (but equally greedy) chromosomes.
+        problem = self.problem
+        chromosome = np.full((len(self.exams), self.slots), EMPTY_SLOT, dtype=np.int32)
+        load = np.zeros((len(problem.teachers), len(problem.weeks)), dtype=np.int64)
+        totals = np.zeros(len(problem.teachers), dtype=np.int64)
+
+        for e in problem.date_order:
+            candidates = problem.eligible_teachers[e]
+            week = problem.exam_weeks[e]
+            infeasible = ~self.available_mask(e, candidates, load, chromosome)
+            order = np.lexsort((self.np_random.random(len(candidates)), totals[candidates], infeasible))
+            chosen = candidates[order[:problem.supervisors_needed[e]]]
+            chromosome[e, :len(chosen)] = chosen
+            load[chosen, week] += 1
+            totals[chosen] += 1
+        return chromosome
 
     def create_initial_population(self):
-        population = []
-        for _ in range(self.population_size):
-            # Create a random assignment of teachers to exams
-            chromosome = {}
-            for exam in self.exams:
-                # Randomly assign required number of teachers to each exam
-                available_teachers = [t for t in self.teachers if self.is_teacher_available(t, exam)]
-                if len(available_teachers) >= exam['supervisors_needed']:
-                    selected_teachers = random.sample(available_teachers, exam['supervisors_needed'])
-                    chromosome[exam['id']] = [t['id'] for t in selected_teachers]
-                else:
-                    # If not enough teachers available, assign as many as possible
-                    chromosome[exam['id']] = [t['id'] for t in available_teachers]
-            population.append(chromosome)
+        problem = self.problem
+        population = np.full((self.population_size, len(self.exams), self.slots), EMPTY_SLOT, dtype=np.int32)
+
+        # Warm start: a share of the population comes from the greedy heuristic, the rest stays random for diversity
+        given = min(len(self.initial_chromosomes), self.population_size)
+        for p in range(given):
+            population[p] = self.initial_chromosomes[p]
+        seeded = min(given + int(round(self.seed_fraction * self.population_size)), self.population_size)
+        for p in range(given, seeded):
+            population[p] = self.greedy_chromosome()
+
+        for p in range(seeded, self.population_size):
+            population[p] = self.random_chromosome()
         return population
 
-    def is_teacher_available(self, teacher, exam):
-        # Check if teacher is available for this exam (no time conflict)
-        # This would include checking weekly supervision limit
-        exam_week = exam['date'].isocalendar()[1]  # Get the week number of the exam
+    def random_chromosome(self):
+        # Create a random assignment of teachers to exams, tracking this chromosome's weekly load so each
+        # capacity check is O(1); exams are visited in random order so none always gets first pick
+        problem = self.problem
+        chromosome = np.full((len(self.exams), self.slots), EMPTY_SLOT, dtype=np.int32)
+        load = np.zeros((len(problem.teachers), len(problem.weeks)), dtype=np.int64)
+        for e in self.np_random.permutation(len(self.exams)):
+            # Randomly assign required number of teachers to each exam
+            # If not enough teachers available, assign as many as possible
+            chosen = self.pick_teachers(e, problem.supervisors_needed[e], load, chromosome)
+            chromosome[e, :len(chosen)] = chosen
+            load[chosen, problem.exam_weeks[e]] += 1
+        return chromosome
+
+    def problem_key(self):
+        # Identifies the teachers and exams a checkpoint belongs to: everything the fitness depends on, including
+        # the durations, which decide which exams overlap
+        problem = self.problem
+        data = repr((problem.teacher_ids, problem.exam_ids, problem.capacities.tolist(),
+                     problem.supervisors_needed.tolist(), [str(exam['date']) for exam in self.exams],
+                     [float(exam['duration']) for exam in self.exams]))
+        return hashlib.blake2b(data.encode(), digest_size=16).hexdigest()
 
-        # Count how many supervisions the teacher already has in this week
-        weekly_supervisions = sum(1 for e in self.exams
-                                  if e['date'].isocalendar()[1] == exam_week
-                                  and teacher['id'] in e.get('assigned_teachers', []))
+    def save_checkpoint(self, population, best_history, generation_times, elapsed):
+        # Everything the remaining generations depend on: the population, the RNG state and the run so far.
+        # The fitness cache only saves work, but is kept so resumed runs report the same cache statistics.
+        arrays = {'population': population}
+        meta = {
+            'problem': self.problem_key(),
+            'best_fitness_history': best_history,
+            'generation_times': generation_times,
+            'elapsed': elapsed,
+            'np_random_state': self.np_random.bit_generator.state,
+            'settings': {'population_size': self.population_size, 'generations': self.generations,
+                         'mutation_rate': self.mutation_rate, 'elite_size': self.elite_size,
+                         'tournament_size': self.tournament_size}
+        }
+        if self.control is not None:
+            meta['adaptive'] = self.control.get_state()
+        if self.fitness_cache is not None:
+            meta['cache_counts'] = [self.fitness_cache.hits, self.fitness_cache.misses]
+            if self.fitness_cache.entries:
+                keys, scores = list(self.fitness_cache.entries), list(self.fitness_cache.entries.values())
+                arrays['cache_keys'] = np.frombuffer(b''.join(keys), dtype=np.uint8).reshape(len(keys), -1)
+                arrays['cache_scores'] = np.array(scores, dtype=np.float64)
+        save_checkpoint(self.checkpoint_path, arrays, meta)
 
-        return weekly_supervisions < teacher['supervision_capacity']
+    def restore_checkpoint(self):
+        # Loads resume_from into this run; returns (population, best_history, generation_times, elapsed)
+        arrays, meta = load_checkpoint(self.resume_from)
+        if meta['problem'] != self.problem_key():
+            raise CheckpointError("The checkpoint was saved for different teachers or exams")
+
+        # An adaptive fork continues from the saved controller when there is one and its operators match
+        adaptive = meta.get('adaptive')
+        if self.control is not None and adaptive is not None and adaptive['operators'] == list(self.mutation_operators):
+            self.control.set_state(adaptive)
+            self.mutation_rate = self.control.mutation_rate
+            self.tournament_size = self.control.tournament_size
+
+        self.np_random.bit_generator.state = meta['np_random_state']
+
+        if self.fitness_cache is not None and 'cache_counts' in meta:
+            for key, score in zip(arrays.get('cache_keys', []), arrays.get('cache_scores', [])):
+                self.fitness_cache.put(key.tobytes(), float(score))
+            self.fitness_cache.hits, self.fitness_cache.misses = meta['cache_counts']
+
+        # A fork may change the population size: saved chromosomes (elites first) are kept, new ones are random
+        population = arrays['population'][:self.population_size]
+        if len(population) < self.population_size:
+            extra = [self.random_chromosome() for _ in range(self.population_size - len(population))]
+            population = np.concatenate([population, extra])
+        return population, meta['best_fitness_history'], meta['generation_times'], meta['elapsed']
+
+    def phase_timer(self, phase):
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.timer(phase)
+
+    def count(self, counter, amount=1):
+        if self.instrumentation is not None:
+            self.instrumentation.count(counter, amount)
 
     def fitness(self, chromosome):
         score = 0
-        teacher_assignments = {t['id']: 0 for t in self.teachers}
-        weekly_assignments = {t['id']: {} for t in self.teachers}
+        teacher_assignments = np.zeros(len(self.teachers), dtype=np.int64)
+        weekly_assignments = {}
+        problem = self.problem
 
         # Check each exam
-        for exam_id, assigned_teachers in chromosome.items():
-            exam = next(e for e in self.exams if e['id'] == exam_id)
-            week_num = exam['date'].isocalendar()[1]
+        for e, needed in enumerate(problem.supervisors_needed):
+            assigned_teachers = chromosome[e][chromosome[e] != EMPTY_SLOT]
+            week_num = problem.week_numbers[e]
 
             # Check if enough teachers are assigned
-            if len(assigned_teachers) < exam['supervisors_needed']:
-                score -= 100 * (exam['supervisors_needed'] - len(assigned_teachers))
+            if len(assigned_teachers) < needed:
+                score -= 100 * (needed - len(assigned_teachers))
 
             # Update assignment counts
-            for teacher_id in assigned_teachers:
-                teacher_assignments[teacher_id] += 1
-
-                if week_num not in weekly_assignments[teacher_id]:
-                    weekly_assignments[teacher_id][week_num] = 0
-                weekly_assignments[teacher_id][week_num] += 1
+            np.add.at(teacher_assignments, assigned_teachers, 1)
+            for t in assigned_teachers:
+                weekly_assignments[(t, week_num)] = weekly_assignments.get((t, week_num), 0) + 1
 
         # Check weekly supervision limits
-        for teacher in self.teachers:
-            teacher_id = teacher['id']
-            for week, count in weekly_assignments[teacher_id].items():
-                if count > teacher['supervision_capacity']:
-                    score -= 50 * (count - teacher['supervision_capacity'])
+        for (t, week), count in weekly_assignments.items():
+            capacity = problem.capacities[t]
+            if count > capacity:
+                score -= 50 * (count - capacity)
+
+        # Check double bookings: a teacher on two exams whose time windows overlap
+        for first, second in problem.conflict_pairs:
+            for t in chromosome[first][chromosome[first] != EMPTY_SLOT]:
+                score -= 100 * int((chromosome[second] == t).sum())
 
         # Reward balanced distribution
-        std_dev = np.std(list(teacher_assignments.values()))
+        std_dev = np.std(teacher_assignments)
         score -= 20 * std_dev
 
         return score
 
+    def fitness_batch(self, population):
+        # Score every chromosome of a (population, exams, slots) array at once; matches fitness()
+        problem = self.problem
+        n_chromosomes = population.shape[0]
+        n_teachers, n_weeks = len(problem.teachers), len(problem.weeks)
+        assigned = population != EMPTY_SLOT
+        chromosome_idx, exam_idx, _ = np.nonzero(assigned)
+        teacher_idx = population[assigned].astype(np.int64)
+
+        # Understaffing
+        staffed = assigned.sum(axis=2)
+        understaffing = np.clip(problem.supervisors_needed - staffed, 0, None).sum(axis=1)
+
+        # Weekly supervision limits
+        teacher_rows = chromosome_idx * n_teachers + teacher_idx
+        weekly = np.bincount(teacher_rows * n_weeks + problem.exam_weeks[exam_idx],
+                             minlength=n_chromosomes * n_teachers * n_weeks)
+        weekly = weekly.reshape(n_chromosomes, n_teachers, n_weeks)
+        over_capacity = np.clip(weekly - problem.capacities[None, :, None], 0, None).sum(axis=(1, 2))
+
+        # Double bookings on overlapping exams
+        conflicts = count_conflicts(problem, population)
+
+        # Balanced distribution
+        teacher_assignments = np.bincount(teacher_rows, minlength=n_chromosomes * n_teachers)
+        std_dev = teacher_assignments.reshape(n_chromosomes, n_teachers).std(axis=1)
+
+        return -100 * understaffing - 50 * over_capacity - 100 * conflicts - 20 * std_dev
+
+    def elite_indices(self, fitness_scores):
+        # The elite_size best chromosomes in ascending fitness order; argpartition avoids a full sort
+        count = min(self.elite_size, len(fitness_scores))
+        if count == 0:
+            return np.empty(0, dtype=np.int64)
+        best = np.argpartition(fitness_scores, len(fitness_scores) - count)[-count:]
+        return best[np.argsort(fitness_scores[best], kind='stable')]
+
+    def select_parent_indices(self, fitness_scores, elite_indices=None):
+        # Elite chromosomes first, then one tournament winner per remaining place. All tournaments are drawn at
+        # once as a (places, tournament_size) matrix of indices (with replacement) and decided by one argmax.
+        if elite_indices is None:
+            elite_indices = self.elite_indices(fitness_scores)
+        places = max(self.population_size - len(elite_indices), 0)
+        tournaments = self.np_random.integers(len(fitness_scores), size=(places, self.tournament_size))
+        winners = tournaments[np.arange(places), np.argmax(fitness_scores[tournaments], axis=1)]
+        return np.concatenate([elite_indices, winners])
+
     def select_parents(self, population, fitness_scores):
-        # Tournament selection
-        tournament_size = 3
-        selected_parents = []
-
-        # Add elite chromosomes first
-        elite_indices = np.argsort(fitness_scores)[-self.elite_size:]
-        for idx in elite_indices:
-            selected_parents.append(population[idx])
-
-        # Tournament selection for the rest
-        while len(selected_parents) < self.population_size:
-            tournament = random.sample(range(len(population)), tournament_size)
-            tournament_fitness = [fitness_scores[i] for i in tournament]
-            winner_idx = tournament[np.argmax(tournament_fitness)]
-            selected_parents.append(population[winner_idx])
-
-        return selected_parents
-
-    def crossover(self, parent1, parent2):
-        child = {}
-        for exam_id in parent1:
-            if random.random() < 0.5:
-                child[exam_id] = parent1[exam_id].copy()
+        return population[self.select_parent_indices(fitness_scores)]
+
+    def crossover(self, parent1, parent2, state=None, take_first=None):
+        # Uniform crossover: each exam's supervisor row comes from either parent (take_first, drawn if not given).
+        # A FitnessState of parent1, if given, is updated in place to describe the child.
+        if take_first is None:
+            take_first = self.np_random.random(len(self.exams)) < 0.5
+        child = np.where(take_first[:, None], parent1, parent2)
+        if state is not None:
+            swapped = np.flatnonzero(~take_first & (parent1 != parent2).any(axis=1))
+            if len(swapped) > DELTA_ROW_LIMIT * len(self.exams):
+                state.reset(child)
             else:
-                child[exam_id] = parent2[exam_id].copy()
+                state.replace_rows(swapped, parent1, child)
         return child
 
-    def mutate(self, chromosome):
-        for exam_id in chromosome:
-            if random.random() < self.mutation_rate:
-                exam = next(e for e in self.exams if e['id'] == exam_id)
+    def set_gene(self, chromosome, e, slot, teacher, load, state=None):
+        # Put a teacher (or EMPTY_SLOT) into a slot, keeping the weekly load or the FitnessState in step
+        old = chromosome[e, slot]
+        week = self.problem.exam_weeks[e]
+        if old != EMPTY_SLOT:
+            if state is not None:
+                state.remove(e, old, chromosome)
+            else:
+                load[old, week] -= 1
+        chromosome[e, slot] = teacher
+        if teacher != EMPTY_SLOT:
+            if state is not None:
+                state.add(e, teacher, chromosome)
+            else:
+                load[teacher, week] += 1
+
+    def swap_gene(self, chromosome, e, load, state=None):
+        # Exchange a teacher of exam e with a teacher of another random exam, unless either already sits on the
+        # other exam
+        assigned = np.flatnonzero(chromosome[e] != EMPTY_SLOT)
+        other = self.np_random.integers(len(self.exams))
+        other_assigned = np.flatnonzero(chromosome[other] != EMPTY_SLOT)
+        if other == e or len(assigned) == 0 or len(other_assigned) == 0:
+            return
+        slot, other_slot = self.np_random.choice(assigned), self.np_random.choice(other_assigned)
+        teacher, other_teacher = chromosome[e, slot], chromosome[other, other_slot]
+        if other_teacher in chromosome[e] or teacher in chromosome[other]:
+            return
+        self.set_gene(chromosome, e, slot, other_teacher, load, state)
+        self.set_gene(chromosome, other, other_slot, teacher, load, state)
+
+    def move_gene(self, chromosome, e, load, state=None):
+        # Move a teacher of exam e onto another exam with a free slot that they are not on and free for,
+        # preferring understaffed exams
+        problem = self.problem
+        assigned = np.flatnonzero(chromosome[e] != EMPTY_SLOT)
+        if len(assigned) == 0:
+            return
+        slot = self.np_random.choice(assigned)
+        teacher = chromosome[e, slot]
+        held = (chromosome == teacher).any(axis=1)
+        held[e] = False
+        staffed = (chromosome != EMPTY_SLOT).sum(axis=1)
+        targets = (staffed < self.slots) & ~held
+        targets[e] = False
+        for x in np.flatnonzero(held):
+            targets[problem.conflicts[x]] = False
+        understaffed = targets & (staffed < problem.supervisors_needed)
+        candidates = np.flatnonzero(understaffed if understaffed.any() else targets)
+        if len(candidates) == 0:
+            return
+        target = self.np_random.choice(candidates)
+        self.set_gene(chromosome, e, slot, EMPTY_SLOT, load, state)
+        self.set_gene(chromosome, target, np.flatnonzero(chromosome[target] == EMPTY_SLOT)[0], teacher, load, state)
+
+    def mutate(self, chromosome, state=None, operator=0, mutated=None):
+        # A FitnessState of the chromosome, if given, is updated in place with every change
+        # (and doubles as the weekly load tracker). operator indexes self.mutation_operators; mutated is the
+        # boolean mask of exams to mutate, drawn from mutation_rate if not given.
+        if mutated is None:
+            mutated = self.np_random.random(len(self.exams)) < self.mutation_rate
+        mutated = np.flatnonzero(mutated)
+        if len(mutated) == 0:
+            return chromosome
+        load = state.weekly if state is not None else self.weekly_load(chromosome)
+        exam_weeks = self.problem.exam_weeks
+        name = self.mutation_operators[operator]
+
+        for e in mutated:
+            if name == 'swap':
+                self.swap_gene(chromosome, e, load, state)
+                continue
+            if name == 'move':
+                self.move_gene(chromosome, e, load, state)
+                continue
+
+            genes = chromosome[e]
+            assigned = np.flatnonzero(genes != EMPTY_SLOT)
+
+            # Either add or remove a teacher
+            if self.np_random.random() < 0.5 and len(assigned) > 0:
+                # Remove a random teacher
+                slot = self.np_random.choice(assigned)
+                if state is not None:
+                    state.remove(e, genes[slot], chromosome)
+                else:
+                    load[genes[slot], exam_weeks[e]] -= 1
+                genes[slot] = EMPTY_SLOT
+            else:
+                # Add a random teacher into a free slot, preferring one with weekly capacity left
+                free = np.flatnonzero(genes == EMPTY_SLOT)
+                if len(free) == 0:
+                    continue
+                chosen = self.pick_teachers(e, 1, load, chromosome)
+                if len(chosen):
+                    genes[free[0]] = chosen[0]
+                    if state is not None:
+                        state.add(e, chosen[0], chromosome)
+                    else:
+                        load[chosen[0], exam_weeks[e]] += 1
+        return chromosome
+
+    def repair(self, chromosome, state=None):
+        # Move supervisions off double-booked teachers and teachers over their weekly capacity onto feasible
+        # teachers, then fill understaffed exams, wherever a feasible teacher exists. Updates the optional
+        # FitnessState in place.
+        problem = self.problem
+        load = state.weekly if state is not None else self.weekly_load(chromosome)
 
-                # Either add or remove a teacher
-                if random.random() < 0.5 and len(chromosome[exam_id]) > 0:
-                    # Remove a random teacher
-                    chromosome[exam_id].remove(random.choice(chromosome[exam_id]))
+        def assign(e, slot, teacher):
+            old = chromosome[e, slot]
+            if old != EMPTY_SLOT:
+                if state is not None:
+                    state.remove(e, old, chromosome)
                 else:
-                    # Add a random teacher
-                    available_teachers = [t['id'] for t in self.teachers
-                                          if t['id'] not in chromosome[exam_id]
-                                          and self.is_teacher_available(t, exam)]
-                    if available_teachers:
-                        chromosome[exam_id].append(random.choice(available_teachers))
+                    load[old, problem.exam_weeks[e]] -= 1
+            chromosome[e, slot] = teacher
+            if state is not None:
+                state.add(e, teacher, chromosome)
+            else:
+                load[teacher, problem.exam_weeks[e]] += 1
+
+        def feasible(e, teacher):
+            return bool(self.available_mask(e, np.array([teacher]), load, chromosome)[0])
+
+        # Double bookings: the teacher is replaced on the second exam of each overlapping pair
+        first, second = problem.conflict_pairs[:, 0], problem.conflict_pairs[:, 1]
+        rows, other = chromosome[first][:, :, None], chromosome[second][:, None, :]
+        pair_idx, _, slot_idx = np.nonzero((rows == other) & (rows != EMPTY_SLOT))
+        for e, slot in zip(second[pair_idx], slot_idx):
+            teacher = chromosome[e, slot]
+            if teacher == EMPTY_SLOT or teacher not in self.busy_teachers(chromosome, e):
+                continue
+            self.count('repair_attempts')
+            replacement = self.pick_teachers(e, 1, load, chromosome)
+            if len(replacement) and feasible(e, replacement[0]):
+                assign(e, slot, replacement[0])
+
+        # Weekly over-capacity
+        for t, w in zip(*np.nonzero(load > problem.capacities[:, None])):
+            week_exams = problem.week_exams[w]
+            for e in week_exams[(chromosome[week_exams] == t).any(axis=1)]:
+                if load[t, w] <= problem.capacities[t]:
+                    break
+                slots = np.flatnonzero(chromosome[e] == t)
+                self.count('repair_attempts')
+                replacement = self.pick_teachers(e, 1, load, chromosome)
+                if len(replacement) and feasible(e, replacement[0]):
+                    assign(e, slots[0], replacement[0])
+
+        # Understaffing
+        staffed = (chromosome != EMPTY_SLOT).sum(axis=1)
+        for e in np.flatnonzero(staffed < problem.supervisors_needed):
+            free = np.flatnonzero(chromosome[e] == EMPTY_SLOT)
+            self.count('repair_attempts')
+            chosen = self.pick_teachers(e, min(problem.supervisors_needed[e] - staffed[e], len(free)), load,
+                                        chromosome)
+            for slot, teacher in zip(free, chosen):
+                if not feasible(e, teacher):
+                    break
+                assign(e, slot, teacher)
         return chromosome
 
-    def evolve(self):
-        population = self.create_initial_population()
+    def worker_pool(self):
+        if self.workers <= 1:
+            return nullcontext()
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                   initargs=(self.teachers, self.exams, self.mutation_operators, self.repair_offspring))
+
+    def evaluate(self, population, pool=None):
+        if self.fitness_cache is None:
+            return self.evaluate_uncached(population, pool)
+
+        # Look up every chromosome; duplicates within the population are evaluated once
+        keys = [FitnessCache.fingerprint(chrom) for chrom in population]
+        fitness_scores = np.empty(len(population))
+        pending = {}
+        for i, key in enumerate(keys):
+            score = self.fitness_cache.get(key)
+            if score is None:
+                pending.setdefault(key, []).append(i)
+            else:
+                fitness_scores[i] = score
+        self.count('cache_hits', len(population) - len(pending))
+        self.count('cache_misses', len(pending))
+
+        if pending:
+            first_indices = [indices[0] for indices in pending.values()]
+            scores = self.evaluate_uncached(population[first_indices], pool)
+            for (key, indices), score in zip(pending.items(), scores):
+                fitness_scores[indices] = score
+                self.fitness_cache.put(key, score)
+        return fitness_scores
+
+    def evaluate_uncached(self, population, pool=None):
+        self.count('fitness_calls', len(population))
+        if pool is None:
+            return self.fitness_batch(population)
+        chunks = np.array_split(population, min(self.workers, len(population)))
+        return np.concatenate(list(pool.map(_evaluate_chunk, chunks)))
+
+    def draw_pairs(self, parent_count, count):
+        # (count, 2) parent indices, two different parents per child whenever there are two
+        first = self.np_random.integers(parent_count, size=count)
+        if parent_count < 2:
+            return np.stack([first, first], axis=1)
+        second = (first + self.np_random.integers(1, parent_count, size=count)) % parent_count
+        return np.stack([first, second], axis=1)
+
+    def draw_masks(self, count):
+        # Uniform-crossover and mutation masks of `count` children, one (children, exams) draw each
+        shape = (count, len(self.exams))
+        return self.np_random.random(shape) < 0.5, self.np_random.random(shape) < self.mutation_rate
 
-        for generation in range(self.generations):
-            fitness_scores = [self.fitness(chrom) for chrom in population]
+    def draw_operators(self, count):
+        # Mutation operator of each child, as indices into self.mutation_operators
+        if self.control is not None:
+            return self.control.draw_operators(self.np_random, count)
+        if len(self.mutation_operators) == 1:
+            return np.zeros(count, dtype=np.int64)
+        return self.np_random.integers(len(self.mutation_operators), size=count)
 
-            # Select parents
-            parents = self.select_parents(population, fitness_scores)
+    def record_offspring(self, pairs, operators, parent_fitness):
+        # Adaptive runs credit each operator once its children are evaluated
+        if self.control is not None and parent_fitness is not None:
+            self.control.record_offspring(operators, parent_fitness[pairs].max(axis=1))
 
-            # Create new population
-            new_population = []
+    def create_offspring(self, parents, count, pool=None, parent_fitness=None):
+        # Pairs, operators and masks for every child are drawn up front; crossover is a single np.where over
+        # all children and mutation only visits the children and exams its mask selected
+        pairs = self.draw_pairs(len(parents), count)
+        operators = self.draw_operators(count)
+        self.record_offspring(pairs, operators, parent_fitness)
+        take_first, mutated = self.draw_masks(count)
 
-            # Keep elite chromosomes
-            elite_indices = np.argsort(fitness_scores)[-self.elite_size:]
-            for idx in elite_indices:
-                new_population.append(population[idx])
+        with self.phase_timer('crossover'):
+            offspring = np.where(take_first[:, :, None], parents[pairs[:, 0]], parents[pairs[:, 1]])
 
-            # Create offspring
-            while len(new_population) < self.population_size:
-                parent1, parent2 = random.sample(parents, 2)
-                child = self.crossover(parent1, parent2)
-                child = self.mutate(child)
-                new_population.append(child)
+        if pool is not None and self.parallel_offspring:
+            with self.phase_timer('offspring'):
+                seeds = self.np_random.integers(0, 2 ** 63, size=count)
+                chunks = np.array_split(np.arange(count), self.workers)
+                results = pool.map(_breed_chunk,
+                                   [offspring[chunk] for chunk in chunks],
+                                   [mutated[chunk] for chunk in chunks],
+                                   [seeds[chunk] for chunk in chunks],
+                                   [operators[chunk] for chunk in chunks])
+                return np.concatenate(list(results))
 
-            population = new_population
+        with self.phase_timer('mutation'):
+            for i in np.flatnonzero(mutated.any(axis=1)):
+                self.mutate(offspring[i], operator=operators[i], mutated=mutated[i])
+        if self.repair_offspring:
+            with self.phase_timer('repair'):
+                for child in offspring:
+                    self.repair(child)
+        return offspring
 
-            # Print progress
-            best_fitness = max(fitness_scores)
-            avg_fitness = sum(fitness_scores) / len(fitness_scores)
-            print(f"Generation {generation}: Best Fitness = {best_fitness}, Avg Fitness = {avg_fitness}")
+    def create_offspring_incremental(self, parents, parent_states, count, parent_fitness=None):
+        # Like create_offspring, but each child's FitnessState is derived from its first parent's
+        pairs = self.draw_pairs(len(parents), count)
+        operators = self.draw_operators(count)
+        self.record_offspring(pairs, operators, parent_fitness)
+        take_first, mutated = self.draw_masks(count)
 
-        # Return the best solution
-        fitness_scores = [self.fitness(chrom) for chrom in population]
+        offspring = np.empty((count,) + parents.shape[1:], dtype=parents.dtype)
+        offspring_states = []
+        for i, (first, second) in enumerate(pairs):
+            with self.phase_timer('crossover'):
+                state = parent_states[first].copy()
+                child = self.crossover(parents[first], parents[second], state, take_first[i])
+            with self.phase_timer('mutation'):
+                offspring[i] = self.mutate(child, state, operators[i], mutated[i])
+            if self.repair_offspring:
+                with self.phase_timer('repair'):
+                    self.repair(offspring[i], state)
+            offspring_states.append(state)
+        return offspring, offspring_states
+
+    def next_generation(self, population, fitness_scores, pool=None):
+        # Select parents; the elites are found once and both kept and used as parents
+        with self.phase_timer('selection'):
+            elite_indices = self.elite_indices(fitness_scores)
+            parent_indices = self.select_parent_indices(fitness_scores, elite_indices)
+            parents = population[parent_indices]
+
+        # Create new population
+        new_population = np.empty_like(population)
+
+        # Keep elite chromosomes
+        new_population[:len(elite_indices)] = population[elite_indices]
+
+        # Create offspring
+        new_population[len(elite_indices):] = self.create_offspring(
+            parents, self.population_size - len(elite_indices), pool, fitness_scores[parent_indices])
+
+        return new_population
+
+    def next_generation_incremental(self, population, states, fitness_scores):
+        # next_generation for incremental mode: returns the new population with one FitnessState per chromosome
+        with self.phase_timer('selection'):
+            elite_indices = self.elite_indices(fitness_scores)
+            parent_indices = self.select_parent_indices(fitness_scores, elite_indices)
+        new_population = np.empty_like(population)
+
+        # Keep elite chromosomes; their states are never modified in place, so they can be shared
+        new_population[:len(elite_indices)] = population[elite_indices]
+        new_states = [states[i] for i in elite_indices]
+
+        # Create offspring
+        offspring, offspring_states = self.create_offspring_incremental(
+            population[parent_indices], [states[i] for i in parent_indices],
+            self.population_size - len(elite_indices), fitness_scores[parent_indices])
+        new_population[len(elite_indices):] = offspring
+
+        return new_population, new_states + offspring_states
+
+    def population_diversity(self, population, fitness_scores):
+        # Mean fraction of genes that differ from the best chromosome (0 = fully converged)
+        best = population[np.argmax(fitness_scores)]
+        return float((population != best).mean())
+
+    def stopping_reason(self, best_history, elapsed, diversity):
+        if self.target_fitness is not None and best_history[-1] >= self.target_fitness:
+            return 'target_fitness'
+        if self.stagnation_generations is not None and len(best_history) > self.stagnation_generations:
+            if max(best_history[-self.stagnation_generations:]) <= best_history[-self.stagnation_generations - 1]:
+                return 'stagnation'
+        if self.time_budget is not None and elapsed >= self.time_budget:
+            return 'time_budget'
+        if diversity is not None and diversity < self.diversity_floor:
+            return 'diversity'
+        return None
+
+    def polish(self, population, fitness_scores, states=None):
+        # Returns the best (chromosome, score) after local search and the search statistics
+        best = int(np.argmax(fitness_scores))
+        result = population[best], float(fitness_scores[best])
+        count = min(self.polish_count, len(population))
+        time_budget = self.polish_time / count if self.polish_time is not None else None
+        search = LocalSearch(self.problem, self.np_random, self.polish_iterations, time_budget)
+
+        with self.phase_timer('polish'):
+            for i in np.argsort(fitness_scores)[::-1][:count]:
+                chromosome, score = search.polish(population[i], states[i] if states is not None else None)
+                if score > result[1]:
+                    result = chromosome, score
+        return result, search.stats()
+
+    def solve(self, progress_callback=print_progress, should_stop=None):
+        # Common solver entry point (see Solvers.create_solver): returns (solution, report)
+        solution, report = self.evolve(progress_callback, should_stop, return_report=True)
+        report['solver'] = 'genetic'
+        return solution, report
+
+    def evolve(self, progress_callback=print_progress, should_stop=None, return_report=False):
+        # progress_callback(generation, best_fitness, avg_fitness) is called after every generation;
+        # should_stop() is polled before each generation and ends the run early with the best-so-far solution.
+        # With return_report=True a (solution, report) tuple is returned, report describing the run.
+        start = time.perf_counter()
+        stop_reason = 'generations'
+        generation_times = []
+        best_history = []
+
+        with self.worker_pool() as pool:
+            if self.resume_from is not None:
+                population, best_history, generation_times, elapsed = self.restore_checkpoint()
+                start -= elapsed
+            else:
+                population = self.create_initial_population()
+            states = [FitnessState(self.problem, chrom) for chrom in population] if self.incremental else None
+
+            for generation in range(len(generation_times), self.generations):
+                if should_stop is not None and should_stop():
+                    stop_reason = 'cancelled'
+                    break
+
+                generation_start = time.perf_counter()
+                with self.phase_timer('evaluation'):
+                    if states is not None:
+                        self.count('fitness_calls', len(states))
+                        fitness_scores = np.array([state.score() for state in states])
+                    else:
+                        fitness_scores = self.evaluate(population, pool)
+                diversity = None
+                if self.diversity_floor is not None or self.instrumentation is not None or self.control is not None:
+                    diversity = self.population_diversity(population, fitness_scores)
+                if self.control is not None:
+                    self.control.update(fitness_scores, diversity)
+                    self.mutation_rate = self.control.mutation_rate
+                    self.tournament_size = self.control.tournament_size
+
+                if states is not None:
+                    population, states = self.next_generation_incremental(population, states, fitness_scores)
+                else:
+                    population = self.next_generation(population, fitness_scores, pool)
+                generation_times.append(time.perf_counter() - generation_start)
+                best_history.append(float(fitness_scores.max()))
+
+                # Report progress
+                if progress_callback is not None:
+                    progress_callback(generation, fitness_scores.max(), fitness_scores.mean())
+                if self.instrumentation is not None:
+                    self.instrumentation.end_generation(generation, fitness_scores, diversity)
+
+                reason = self.stopping_reason(best_history, time.perf_counter() - start,
+                                              diversity if self.diversity_floor is not None else None)
+                if reason is not None:
+                    stop_reason = reason
+                    break
+                periodic = self.checkpoint_every and (generation + 1) % self.checkpoint_every == 0
+                if self.checkpoint_path is not None and periodic:
+                    self.save_checkpoint(population, best_history, generation_times, time.perf_counter() - start)
+
+            if self.checkpoint_path is not None:
+                self.save_checkpoint(population, best_history, generation_times, time.perf_counter() - start)
+
+            # Return the best solution; elitism keeps the best-so-far chromosome in the population
+            if states is not None:
+                fitness_scores = np.array([state.score() for state in states])
+            else:
+                fitness_scores = self.evaluate(population, pool)
         best_idx = np.argmax(fitness_scores)
-        return population[best_idx]
\ No newline at end of file
+        best_chromosome, best_fitness = population[best_idx], float(fitness_scores[best_idx])
+        polish_stats = None
+        if self.polish_count:
+            (best_chromosome, best_fitness), polish_stats = self.polish(population, fitness_scores, states)
+        solution = self.problem.decode(best_chromosome)
+
+        if not return_report:
+            return solution
+        report = {
+            'generations': len(generation_times),
+            'stop_reason': stop_reason,
+            'best_fitness': best_fitness,
+            'best_fitness_history': best_history,
+            'generation_times': generation_times,
+            'elapsed': time.perf_counter() - start,
+            'cache': self.fitness_cache.stats() if self.fitness_cache is not None else None,
+            'polish': polish_stats,
+            'adaptive': self.control.stats() if self.control is not None else None
+        }
+        return solution, report
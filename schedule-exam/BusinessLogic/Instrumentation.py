@@ -0,0 +1,97 @@
+import csv
+import json
+import time
+from contextlib import contextmanager
+
+PHASES = ['evaluation', 'selection', 'crossover', 'mutation', 'repair', 'offspring', 'polish']
+COUNTERS = ['fitness_calls', 'cache_hits', 'cache_misses', 'repair_attempts', 'eligibility_lookups']
+
+
+class Instrumentation:
+    # Opt-in per-generation metrics for GeneticAlgorithm. The engine only touches this object when one is
+    # passed in, so a disabled run pays a single None check per hook.
+    #
+    # Observers are callables receiving one record dict per generation:
+    #   {'generation', 'best', 'avg', 'worst', 'diversity', 'timings': {phase: seconds}, 'counters': {name: n}}
+
+    def __init__(self):
+        self.observers = []
+        self.records = []
+        self.timings = dict.fromkeys(PHASES, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+
+    def subscribe(self, observer):
+        self.observers.append(observer)
+        return observer
+
+    @contextmanager
+    def timer(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.0) + time.perf_counter() - start
+
+    def count(self, counter, amount=1):
+        self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def end_generation(self, generation, fitness_scores, diversity):
+        record = {
+            'generation': generation,
+            'best': float(fitness_scores.max()),
+            'avg': float(fitness_scores.mean()),
+            'worst': float(fitness_scores.min()),
+            'diversity': diversity,
+            'timings': self.timings,
+            'counters': self.counters
+        }
+        self.timings = dict.fromkeys(PHASES, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        return self.publish(record)
+
+    def publish(self, record):
+        # Also used to forward records collected by another Instrumentation, e.g. in a worker process
+        self.records.append(record)
+        for observer in self.observers:
+            observer(record)
+        return record
+
+
+class JsonLinesExporter:
+    # Observer writing one JSON object per generation
+    def __init__(self, filename):
+        self.file = open(filename, 'w', encoding='utf-8')
+
+    def __call__(self, record):
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class CsvExporter:
+    # Observer writing one flat CSV row per generation (timings and counters become columns)
+    def __init__(self, filename):
+        self.file = open(filename, 'w', encoding='utf-8', newline='')
+        fieldnames = (['generation', 'best', 'avg', 'worst', 'diversity'] +
+                      [f"time_{phase}" for phase in PHASES] + COUNTERS)
+        self.writer = csv.DictWriter(self.file, fieldnames=fieldnames, restval=0, extrasaction='ignore')
+        self.writer.writeheader()
+
+    def __call__(self, record):
+        row = {key: value for key, value in record.items() if key not in ('timings', 'counters')}
+        row.update({f"time_{phase}": seconds for phase, seconds in record['timings'].items()})
+        row.update(record['counters'])
+        self.writer.writerow(row)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def exporter_for(filename):
+    # Pick the exporter from the file extension: .csv, anything else is JSON lines
+    if filename.lower().endswith('.csv'):
+        return CsvExporter(filename)
+    return JsonLinesExporter(filename)
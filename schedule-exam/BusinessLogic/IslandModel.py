@@ -0,0 +1,239 @@
+import multiprocessing
+import queue
+import time
+
+import numpy as np
+
+from BusinessLogic.FitnessState import FitnessState
+from BusinessLogic.GeneticAlgorithm import GeneticAlgorithm, print_progress
+from BusinessLogic.Instrumentation import Instrumentation
+
+TOPOLOGIES = ('ring', 'bidirectional_ring', 'fully_connected')
+
+
+def neighbours(island, islands, topology):
+    # Islands that receive migrants from the given island
+    if topology not in TOPOLOGIES:
+        raise ValueError(f"Unknown migration topology: {topology}")
+    if islands < 2:
+        return []
+    if topology == 'ring':
+        return [(island + 1) % islands]
+    if topology == 'bidirectional_ring':
+        return sorted({(island - 1) % islands, (island + 1) % islands})
+    return [i for i in range(islands) if i != island]
+
+
+def _receive(inbox, pending, generation, count, stop):
+    # Blocks until `count` migrant messages of the given generation's epoch have arrived and returns them,
+    # giving up (returns None) once the run is being stopped. A neighbour may already be an epoch ahead, so
+    # messages for later epochs are kept in `pending` ({generation: [(source, migrants), ...]}).
+    while len(pending.get(generation, ())) < count:
+        try:
+            source, sent_at, migrants = inbox.get(timeout=0.1)
+        except queue.Empty:
+            if stop.is_set():
+                return None
+            continue
+        pending.setdefault(sent_at, []).append((source, migrants))
+    return pending.pop(generation)
+
+
+def _run_island(island, teachers, exams, ga_options, seed, generations, migration_interval, migration_size,
+                outboxes, inbox, incoming, results, progress, stop, instrument):
+    # One island's GA, run generation by generation like GeneticAlgorithm.evolve (incremental scoring, adaptive
+    # control, final polish). Each generation sends (island, generation, best, avg, diversity, metrics record
+    # or None) to `progress`; early stopping is decided by the parent, which sets `stop`.
+    instrumentation = Instrumentation() if instrument else None
+    ga = GeneticAlgorithm(teachers, exams, seed=seed, instrumentation=instrumentation, **ga_options)
+    population = ga.create_initial_population()
+    states = [FitnessState(ga.problem, chrom) for chrom in population] if ga.incremental else None
+
+    def evaluate():
+        if states is not None:
+            ga.count('fitness_calls', len(states))
+            return np.array([state.score() for state in states])
+        return ga.evaluate(population)
+
+    completed = 0
+    pending = {}
+    for generation in range(1, generations + 1):
+        if stop.is_set():
+            break
+        with ga.phase_timer('evaluation'):
+            fitness_scores = evaluate()
+        diversity = None
+        if ga.diversity_floor is not None or instrument or ga.control is not None:
+            diversity = ga.population_diversity(population, fitness_scores)
+        if ga.control is not None:
+            ga.control.update(fitness_scores, diversity)
+            ga.mutation_rate = ga.control.mutation_rate
+            ga.tournament_size = ga.control.tournament_size
+
+        if states is not None:
+            population, states = ga.next_generation_incremental(population, states, fitness_scores)
+        else:
+            population = ga.next_generation(population, fitness_scores)
+        record = instrumentation.end_generation(generation - 1, fitness_scores, diversity) if instrument else None
+        progress.put((island, generation - 1, float(fitness_scores.max()), float(fitness_scores.mean()), diversity,
+                      record))
+        completed = generation
+
+        # Migration epoch: send our best to the neighbours, replace our worst with theirs
+        if incoming and migration_interval and generation % migration_interval == 0 and generation < generations:
+            fitness_scores = evaluate()
+            emigrants = population[np.argsort(fitness_scores)[-migration_size:]]
+            for outbox in outboxes:
+                outbox.put((island, generation, emigrants))
+
+            # Order by source island so seeded runs don't depend on message arrival order
+            arrivals = _receive(inbox, pending, generation, incoming, stop)
+            if arrivals is None:
+                break
+            arrivals.sort(key=lambda arrival: arrival[0])
+            immigrants = np.concatenate([migrants for _, migrants in arrivals])[:len(population) - ga.elite_size]
+            replaced = np.argsort(fitness_scores)[:len(immigrants)]
+            population[replaced] = immigrants
+            if states is not None:
+                # New state objects rather than in-place updates: elite states may be shared
+                for i in replaced:
+                    states[i] = FitnessState(ga.problem, population[i])
+
+    fitness_scores = evaluate()
+    best_idx = int(np.argmax(fitness_scores))
+    best_chromosome, best_fitness = population[best_idx], float(fitness_scores[best_idx])
+    polish_stats = None
+    if ga.polish_count:
+        (best_chromosome, best_fitness), polish_stats = ga.polish(population, fitness_scores, states)
+    stats = {'polish': polish_stats, 'adaptive': ga.control.stats() if ga.control is not None else None}
+    results.put((island, best_fitness, best_chromosome, completed, stats))
+
+
+class IslandModel:
+    # Island-model GA: independent GeneticAlgorithm populations evolve in separate processes and periodically
+    # send their best chromosomes to neighbouring islands
+
+    def __init__(self, teachers, exams, islands=4, migration_interval=10, migration_size=2, topology='ring',
+                 generations=100, seed=None, **ga_options):
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Unknown migration topology: {topology}")
+
+        self.teachers = teachers
+        self.exams = exams
+        self.islands = islands
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.topology = topology
+        self.generations = generations
+        self.seed = seed
+        # Remaining GeneticAlgorithm settings (population_size, mutation_rate, ...) apply to every island
+        self.ga_options = ga_options
+
+        self.best_fitness = None
+        self.island_fitness = []
+
+    def solve(self, progress_callback=print_progress, should_stop=None):
+        # Common solver entry point (see Solvers.create_solver): returns (solution, report). Progress is reported
+        # once every island has finished a generation, with the best and mean fitness over the islands.
+        # should_stop() and the early stopping criteria (on the best fitness over the islands and their mean
+        # diversity) are checked in this process; the islands stop at their next generation or migration epoch.
+        start = time.perf_counter()
+        seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(self.seed).spawn(self.islands)]
+        routes = [neighbours(i, self.islands, self.topology) for i in range(self.islands)]
+        incoming = [sum(i in targets for targets in routes) for i in range(self.islands)]
+        ga_options = {key: value for key, value in self.ga_options.items() if key != 'instrumentation'}
+        instrumentation = self.ga_options.get('instrumentation')
+        # Holds the shared settings for the stopping criteria, and the problem for decoding
+        settings = GeneticAlgorithm(self.teachers, self.exams, generations=self.generations, **ga_options)
+        stop_reason = 'generations'
+
+        inboxes = [multiprocessing.Queue() for _ in range(self.islands)]
+        results = multiprocessing.Queue()
+        progress = multiprocessing.Queue()
+        stop = multiprocessing.Event()
+        processes = [multiprocessing.Process(
+            target=_run_island,
+            args=(i, self.teachers, self.exams, ga_options, seeds[i], self.generations,
+                  self.migration_interval, self.migration_size, [inboxes[j] for j in routes[i]],
+                  inboxes[i], incoming[i], results, progress, stop, instrumentation is not None))
+            for i in range(self.islands)]
+
+        for process in processes:
+            process.start()
+        # Per generation: (best, mean, diversity) of each island that has reported it
+        generation_fitness = {}
+        best_history = []
+
+        def drain():
+            nonlocal stop_reason
+            while True:
+                try:
+                    island, generation, best, avg, diversity, record = progress.get_nowait()
+                except queue.Empty:
+                    return
+                if record is not None:
+                    # Records from another process, tagged with the island they came from
+                    instrumentation.publish(dict(record, island=island))
+                scores = generation_fitness.setdefault(generation, [])
+                scores.append((best, avg, diversity))
+                if len(scores) < self.islands:
+                    continue
+                del generation_fitness[generation]
+                best_history.append(max(score[0] for score in scores))
+                if progress_callback is not None:
+                    progress_callback(generation, best_history[-1], float(np.mean([score[1] for score in scores])))
+                diversity = None
+                if settings.diversity_floor is not None:
+                    diversity = float(np.mean([score[2] for score in scores]))
+                reason = settings.stopping_reason(best_history, time.perf_counter() - start, diversity)
+                if reason is not None and not stop.is_set():
+                    stop_reason = reason
+                    stop.set()
+
+        # Drain results before joining so large chromosomes can't block the queue feeder threads
+        outcomes = []
+        while len(outcomes) < self.islands:
+            drain()
+            if should_stop is not None and not stop.is_set() and should_stop():
+                stop_reason = 'cancelled'
+                stop.set()
+            try:
+                outcomes.append(results.get(timeout=0.1))
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    for process in processes:
+                        process.terminate()
+                    raise RuntimeError("An island process failed during evolution")
+        for process in processes:
+            process.join()
+        drain()
+        outcomes.sort(key=lambda outcome: outcome[0])
+
+        self.island_fitness = [outcome[1] for outcome in outcomes]
+        best_island = int(np.argmax(self.island_fitness))
+        self.best_fitness = self.island_fitness[best_island]
+        generations = min(outcome[3] for outcome in outcomes)
+        stats = [outcome[4] for outcome in outcomes]
+
+        report = {
+            'solver': 'island',
+            # Generations every island completed
+            'generations': generations,
+            'stop_reason': stop_reason,
+            'best_fitness': self.best_fitness,
+            'best_fitness_history': best_history,
+            'generation_times': [],
+            'elapsed': time.perf_counter() - start,
+            'cache': None,
+            'islands': self.islands,
+            'topology': self.topology,
+            'island_fitness': self.island_fitness,
+            # Per island, like the genetic solver's report entries
+            'polish': [island['polish'] for island in stats] if settings.polish_count else None,
+            'adaptive': [island['adaptive'] for island in stats] if settings.control is not None else None
+        }
+        # Same {exam_id: [teacher_id, ...]} shape that GeneticAlgorithm.evolve returns
+        return settings.problem.decode(outcomes[best_island][2]), report
+
+    def evolve(self):
+        return self.solve(progress_callback=None)[0]
@@ -0,0 +1,181 @@
+import time
+from collections import deque
+
+import numpy as np
+
+from BusinessLogic.FitnessState import FitnessState
+from BusinessLogic.ProblemInstance import EMPTY_SLOT
+
+MOVES = ('fill', 'move', 'swap')
+
+
+class LocalSearch:
+    # Tabu-flavoured hill climbing on one chromosome, scored incrementally with FitnessState. Each iteration
+    # tries one neighbour and keeps it unless it scores worse:
+    #   fill - give an understaffed exam one more supervisor
+    #   move - hand a double-booked, over-capacity (or the busiest) teacher's supervision to a light teacher
+    #   swap - exchange supervisors between two exams of the same week
+    # Recently removed (exam, teacher) pairs are tabu for `tabu_tenure` iterations so moves aren't undone at once.
+    #
+    # For re-optimization, only exams in the `movable` mask are changed, and with a `reference` chromosome every
+    # reference assignment that is lost costs `churn_penalty`.
+
+    def __init__(self, problem, np_random, iterations=1000, time_budget=None, tabu_tenure=20, movable=None,
+                 reference=None, churn_penalty=0):
+        self.problem = problem
+        self.np_random = np_random
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.tabu_tenure = tabu_tenure
+        self.movable = np.ones(len(problem.exams), dtype=bool) if movable is None else movable
+        self.reference = reference
+        self.churn_penalty = churn_penalty
+        self.churn = 0
+
+        self.accepted = dict.fromkeys(MOVES, 0)
+        self.tried = dict.fromkeys(MOVES, 0)
+
+    def light_teacher(self, chromosome, state, exam, tabu):
+        # Lightest eligible teacher not on the exam, among those with weekly capacity left and no overlapping
+        # exam if any
+        problem = self.problem
+        candidates = problem.eligible_teachers[exam]
+        candidates = candidates[np.isin(candidates, chromosome[exam], invert=True)]
+        candidates = np.array([t for t in candidates if (exam, t) not in tabu], dtype=np.int64)
+        if len(candidates) == 0:
+            return None
+        feasible = ((state.weekly[candidates, problem.exam_weeks[exam]] < problem.capacities[candidates]) &
+                    np.isin(candidates, chromosome[problem.conflicts[exam]], invert=True))
+        if feasible.any():
+            candidates = candidates[feasible]
+        lightest = candidates[state.totals[candidates] == state.totals[candidates].min()]
+        return int(self.np_random.choice(lightest))
+
+    def heavy_gene(self, chromosome, state):
+        # (exam, slot) of a supervision worth moving: a double booking, a teacher over their weekly capacity,
+        # else the busiest teacher
+        problem = self.problem
+        if state.conflicts:
+            first, second = problem.conflict_pairs[:, 0], problem.conflict_pairs[:, 1]
+            rows, other = chromosome[first][:, :, None], chromosome[second][:, None, :]
+            pair_idx, first_slots, slot_idx = np.nonzero((rows == other) & (rows != EMPTY_SLOT))
+            exams = np.concatenate([second[pair_idx], first[pair_idx]])
+            slots = np.concatenate([slot_idx, first_slots])
+            gene = self.pick_movable(exams, slots)
+            if gene is not None:
+                return gene
+
+        over = np.argwhere(state.weekly > problem.capacities[:, None])
+        if len(over):
+            teacher, week = over[self.np_random.integers(len(over))]
+            exams = problem.week_exams[week]
+            rows, slots = np.nonzero(chromosome[exams] == teacher)
+            gene = self.pick_movable(exams[rows], slots)
+            if gene is not None:
+                return gene
+
+        busiest = np.flatnonzero(state.totals == state.totals.max())
+        exams, slots = np.nonzero(chromosome == self.np_random.choice(busiest))
+        return self.pick_movable(exams, slots)
+
+    def pick_movable(self, exams, slots):
+        keep = self.movable[exams]
+        if not keep.any():
+            return None
+        pick = self.np_random.integers(keep.sum())
+        return exams[keep][pick], slots[keep][pick]
+
+    def propose(self, chromosome, state, tabu):
+        # Returns (move, [(exam, slot, new_teacher), ...]) or None when the move doesn't apply
+        problem = self.problem
+        move = MOVES[self.np_random.integers(len(MOVES))]
+
+        if move == 'fill':
+            understaffed = np.flatnonzero((state.staffed < problem.supervisors_needed) & self.movable)
+            if len(understaffed) == 0:
+                return None
+            exam = self.np_random.choice(understaffed)
+            teacher = self.light_teacher(chromosome, state, exam, tabu)
+            if teacher is None:
+                return None
+            return move, [(exam, np.flatnonzero(chromosome[exam] == EMPTY_SLOT)[0], teacher)]
+
+        if move == 'move':
+            gene = self.heavy_gene(chromosome, state)
+            if gene is None:
+                return None
+            exam, slot = gene
+            teacher = self.light_teacher(chromosome, state, exam, tabu)
+            if teacher is None:
+                return None
+            return move, [(exam, slot, teacher)]
+
+        exams = problem.week_exams[self.np_random.integers(len(problem.weeks))]
+        exams = exams[self.movable[exams]]
+        if len(exams) < 2:
+            return None
+        first, second = self.np_random.choice(exams, 2, replace=False)
+        first_slots = np.flatnonzero(chromosome[first] != EMPTY_SLOT)
+        second_slots = np.flatnonzero(chromosome[second] != EMPTY_SLOT)
+        if len(first_slots) == 0 or len(second_slots) == 0:
+            return None
+        first_slot, second_slot = self.np_random.choice(first_slots), self.np_random.choice(second_slots)
+        a, b = chromosome[first, first_slot], chromosome[second, second_slot]
+        if b in chromosome[first] or a in chromosome[second]:
+            return None
+        return move, [(first, first_slot, b), (second, second_slot, a)]
+
+    def apply(self, chromosome, state, changes):
+        # Applies the changes and returns the ones that undo them
+        undo = []
+        for exam, slot, teacher in changes:
+            old = chromosome[exam, slot]
+            if old != EMPTY_SLOT:
+                state.remove(exam, old, chromosome)
+                if self.reference is not None and old in self.reference[exam]:
+                    self.churn += 1
+            chromosome[exam, slot] = teacher
+            if teacher != EMPTY_SLOT:
+                state.add(exam, teacher, chromosome)
+                if self.reference is not None and teacher in self.reference[exam]:
+                    self.churn -= 1
+            undo.append((exam, slot, old))
+        return undo[::-1]
+
+    def score(self, state):
+        return state.score() - self.churn_penalty * self.churn
+
+    def polish(self, chromosome, state=None):
+        # Improves a copy of the chromosome; returns (chromosome, score), the score including the churn penalty
+        chromosome = chromosome.copy()
+        state = FitnessState(self.problem, chromosome) if state is None else state.copy()
+        if self.reference is not None:
+            kept = (self.reference[:, :, None] == chromosome[:, None, :]).any(axis=2)
+            self.churn = int(((self.reference != EMPTY_SLOT) & ~kept).sum())
+        score = self.score(state)
+        tabu = deque(maxlen=self.tabu_tenure)
+        tabu_set = set()
+        start = time.perf_counter()
+
+        for _ in range(self.iterations):
+            if self.time_budget is not None and time.perf_counter() - start >= self.time_budget:
+                break
+            proposal = self.propose(chromosome, state, tabu_set)
+            if proposal is None:
+                continue
+            move, changes = proposal
+            self.tried[move] += 1
+            undo = self.apply(chromosome, state, changes)
+            new_score = self.score(state)
+            if new_score < score:
+                self.apply(chromosome, state, undo)
+                continue
+
+            self.accepted[move] += 1
+            score = new_score
+            tabu.extend((exam, old) for exam, _, old in undo if old != EMPTY_SLOT)
+            tabu_set = set(tabu)
+        return chromosome, score
+
+    def stats(self):
+        return {'tried': dict(self.tried), 'accepted': dict(self.accepted)}
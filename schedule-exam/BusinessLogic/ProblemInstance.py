@@ -0,0 +1,96 @@
+from types import MappingProxyType
+
+import numpy as np
+
+# Marker for an empty supervisor slot in an encoded chromosome
+EMPTY_SLOT = -1
+
+
+def _read_only(array):
+    array.setflags(write=False)
+    return array
+
+
+class ProblemInstance:
+    # Immutable view of one scheduling problem: every lookup the GA operators need, derived once per run.
+    # Teachers and exams are addressed by position (index), ids are only used at the dict boundary.
+
+    def __init__(self, teachers, exams):
+        self.teachers = tuple(teachers)
+        self.exams = tuple(exams)
+
+        # Id <-> index lookups
+        self.teacher_ids = tuple(t['id'] for t in teachers)
+        self.exam_ids = tuple(e['id'] for e in exams)
+        self.teacher_index = MappingProxyType({teacher_id: i for i, teacher_id in enumerate(self.teacher_ids)})
+        self.exam_index = MappingProxyType({exam_id: i for i, exam_id in enumerate(self.exam_ids)})
+
+        # Per-exam and per-teacher constraints
+        self.supervisors_needed = _read_only(np.array([e['supervisors_needed'] for e in exams], dtype=np.int64))
+        self.capacities = _read_only(np.array([t['supervision_capacity'] for t in teachers], dtype=np.int64))
+        self.slots = int(max(self.supervisors_needed.max(initial=0), 1))
+
+        # ISO week numbers, the dense week index of each exam, and the exams of each week (by week index)
+        self.week_numbers = _read_only(np.array([e['date'].isocalendar()[1] for e in exams], dtype=np.int64))
+        weeks, exam_weeks = np.unique(self.week_numbers, return_inverse=True)
+        self.weeks = _read_only(weeks)
+        self.exam_weeks = _read_only(exam_weeks.reshape(-1))
+        self.week_exams = tuple(_read_only(np.flatnonzero(self.exam_weeks == w)) for w in range(len(self.weeks)))
+
+        # Interval index of exams whose [date, date + duration) windows overlap, built with one sort and a
+        # binary search per exam: conflict_pairs holds each pair once (first < second), conflicts[e] the exams
+        # overlapping e
+        self.starts = _read_only(np.array([e['date'].timestamp() for e in exams], dtype=np.float64))
+        self.ends = _read_only(self.starts + 3600 * np.array([e['duration'] for e in exams], dtype=np.float64))
+        self.conflict_pairs = _read_only(self.overlapping_pairs(self.starts, self.ends))
+        both_ways = np.concatenate([self.conflict_pairs, self.conflict_pairs[:, ::-1]])
+        both_ways = both_ways[np.lexsort((both_ways[:, 1], both_ways[:, 0]))]
+        bounds = np.searchsorted(both_ways[:, 0], np.arange(len(self.exams) + 1))
+        self.conflicts = tuple(_read_only(both_ways[bounds[e]:bounds[e + 1], 1]) for e in range(len(self.exams)))
+
+        # Exam indices in chronological order
+        self.date_order = _read_only(np.array(sorted(range(len(self.exams)), key=lambda e: self.exams[e]['date']),
+                                              dtype=np.int64))
+
+        # Teacher x exam eligibility: static constraints only (a teacher with no supervision capacity is never
+        # eligible). Weekly load depends on the chromosome being built and is checked by the GA operators.
+        eligibility = np.broadcast_to(self.capacities[:, None] > 0, (len(self.teachers), len(self.exams))).copy()
+        self.eligibility = _read_only(eligibility)
+        self.eligible_teachers = tuple(_read_only(np.flatnonzero(eligibility[:, e])) for e in range(len(self.exams)))
+
+        self._frozen = True
+
+    def encode(self, solution):
+        # Convert a {exam_id: [teacher_id, ...]} dict into an encoded chromosome: one row per exam, one column
+        # per supervisor slot, holding teacher indices or EMPTY_SLOT
+        chromosome = np.full((len(self.exams), self.slots), EMPTY_SLOT, dtype=np.int32)
+        for e, exam_id in enumerate(self.exam_ids):
+            genes = [self.teacher_index[t] for t in solution.get(exam_id, [])][:self.slots]
+            chromosome[e, :len(genes)] = genes
+        return chromosome
+
+    def decode(self, chromosome):
+        # Convert an encoded chromosome back into the {exam_id: [teacher_id, ...]} dict used by the UI
+        return {exam_id: [self.teacher_ids[t] for t in chromosome[e] if t != EMPTY_SLOT]
+                for e, exam_id in enumerate(self.exam_ids)}
+
+    @staticmethod
+    def overlapping_pairs(starts, ends):
+        # Sweep over exams sorted by start: exam i overlaps every later-starting exam that starts before i ends
+        order = np.argsort(starts, kind='stable')
+        sorted_starts = starts[order]
+        last = np.searchsorted(sorted_starts, ends[order], side='left')
+        counts = np.maximum(last - np.arange(len(order)) - 1, 0)
+        first = np.repeat(np.arange(len(order)), counts)
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        pairs = np.stack([order[first], order[first + 1 + offsets]], axis=1)
+        return np.sort(pairs, axis=1).reshape(-1, 2).astype(np.int64)
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"ProblemInstance is immutable, cannot set '{name}'")
+        super().__setattr__(name, value)
+
+    def __reduce__(self):
+        # Mapping proxies don't pickle; rebuild from the source records instead
+        return ProblemInstance, (list(self.teachers), list(self.exams))
@@ -0,0 +1,124 @@
+import time
+
+import numpy as np
+
+from BusinessLogic.FitnessState import FitnessState
+from BusinessLogic.LocalSearch import LocalSearch
+from BusinessLogic.ProblemInstance import EMPTY_SLOT, ProblemInstance
+
+
+class Reoptimizer:
+    # Repairs a published schedule after late changes (new or edited exams, teachers removed or unavailable)
+    # instead of solving from scratch. Exams whose assignment is still valid stay frozen; only affected exams are
+    # re-solved, widened to their whole weeks if that isn't enough to clear the hard violations. Every published
+    # (exam, teacher) assignment that is dropped costs churn_penalty, so unaffected supervisors keep their duties.
+    #
+    # An exam is affected when it is new, lost a supervisor (teacher gone or unavailable), is understaffed, is
+    # double-booked, or has a supervisor over their weekly capacity.
+
+    def __init__(self, teachers, exams, previous_solution, unavailable=(), churn_penalty=10, iterations=2000,
+                 time_budget=None, seed=None):
+        # Unavailable teachers keep their records (and ids) but can't take any supervision
+        unavailable = set(unavailable)
+        self.teachers = [dict(t, supervision_capacity=0) if t['id'] in unavailable else t for t in teachers]
+        self.exams = exams
+        self.previous_solution = previous_solution
+        self.churn_penalty = churn_penalty
+        self.iterations = iterations
+        self.time_budget = time_budget
+        self.np_random = np.random.default_rng(seed)
+        self.problem = ProblemInstance(self.teachers, exams)
+        self.slots = self.problem.slots
+        self.generations = 1
+
+    def encode_previous(self):
+        # Published assignments as a chromosome; returns it with the mask of exams that lost a supervisor
+        problem = self.problem
+        kept = {}
+        changed = np.zeros(len(problem.exams), dtype=bool)
+        for e, exam_id in enumerate(problem.exam_ids):
+            if exam_id not in self.previous_solution:
+                changed[e] = True
+                continue
+            published = self.previous_solution[exam_id]
+            kept[exam_id] = [t for t in published
+                             if t in problem.teacher_index and problem.eligibility[problem.teacher_index[t], e]]
+            kept[exam_id] = kept[exam_id][:self.slots]
+            changed[e] = len(kept[exam_id]) < len(published)
+        return problem.encode(kept), changed
+
+    def violating_exams(self, chromosome, state):
+        problem = self.problem
+        affected = state.staffed < problem.supervisors_needed
+
+        first, second = problem.conflict_pairs[:, 0], problem.conflict_pairs[:, 1]
+        rows, other = chromosome[first][:, :, None], chromosome[second][:, None, :]
+        pair_idx = np.nonzero((rows == other) & (rows != EMPTY_SLOT))[0]
+        affected[first[pair_idx]] = True
+        affected[second[pair_idx]] = True
+
+        over = state.weekly > problem.capacities[:, None]
+        assigned = chromosome != EMPTY_SLOT
+        exam_idx = np.nonzero(assigned)[0]
+        over_genes = over[chromosome[assigned], problem.exam_weeks[exam_idx]]
+        affected[exam_idx[over_genes]] = True
+        return affected
+
+    def fill(self, search, chromosome, state):
+        # Staff understaffed movable exams with the lightest feasible teachers before searching
+        problem = self.problem
+        for e in np.flatnonzero((state.staffed < problem.supervisors_needed) & search.movable):
+            free = np.flatnonzero(chromosome[e] == EMPTY_SLOT)
+            for slot in free[:problem.supervisors_needed[e] - state.staffed[e]]:
+                teacher = search.light_teacher(chromosome, state, e, ())
+                if teacher is None:
+                    break
+                search.apply(chromosome, state, [(e, slot, teacher)])
+
+    def solve(self, progress_callback=None, should_stop=None):
+        # Same (solution, report) result as GeneticAlgorithm.solve
+        start = time.perf_counter()
+        problem = self.problem
+        reference, changed = self.encode_previous()
+        chromosome = reference.copy()
+        state = FitnessState(problem, chromosome)
+        affected = changed | self.violating_exams(chromosome, state)
+
+        # Affected exams first; if hard violations remain, every exam of the affected weeks
+        movable = affected
+        for widen in (False, True):
+            if widen:
+                if not self.violating_exams(chromosome, state).any():
+                    break
+                movable = np.isin(problem.exam_weeks, problem.exam_weeks[affected])
+            if not movable.any() or (should_stop is not None and should_stop()):
+                continue
+            search = LocalSearch(problem, self.np_random, self.iterations, self.time_budget, movable=movable,
+                                 reference=reference, churn_penalty=self.churn_penalty)
+            self.fill(search, chromosome, state)
+            chromosome, _ = search.polish(chromosome, state)
+            state = FitnessState(problem, chromosome)
+
+        fitness = state.score()
+        if progress_callback is not None:
+            progress_callback(0, fitness, fitness)
+
+        solution = problem.decode(chromosome)
+        # Published (exam, teacher) assignments that are no longer in the schedule
+        dropped = sum(len(set(published) - set(solution.get(exam_id, [])))
+                      for exam_id, published in self.previous_solution.items())
+
+        report = {
+            'solver': 'reoptimize',
+            'generations': 0,
+            'stop_reason': 'cancelled' if should_stop is not None and should_stop() else 'reoptimized',
+            'best_fitness': float(fitness),
+            'best_fitness_history': [float(fitness)],
+            'generation_times': [],
+            'elapsed': time.perf_counter() - start,
+            'cache': None,
+            'affected_exams': int(affected.sum()),
+            'movable_exams': int(movable.sum()),
+            'changed_assignments': dropped
+        }
+        return solution, report
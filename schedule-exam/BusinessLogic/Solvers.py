@@ -0,0 +1,59 @@
+from BusinessLogic.FlowSolver import FlowSolver
+from BusinessLogic.GeneticAlgorithm import GeneticAlgorithm, print_progress
+from BusinessLogic.IslandModel import IslandModel
+from BusinessLogic.WeekDecomposition import WeekDecomposition
+
+SOLVERS = ('genetic', 'flow', 'hybrid', 'weekly', 'island')
+
+
+class HybridSolver:
+    # Flow solution first, then the genetic algorithm starting from it; elitism keeps the flow schedule unless
+    # the GA finds a better trade-off between the soft penalties
+
+    def __init__(self, teachers, exams, seed=None, **ga_options):
+        self.teachers = teachers
+        self.exams = exams
+        self.seed = seed
+        self.ga_options = ga_options
+        self.generations = ga_options.get('generations', 100)
+
+    def solve(self, progress_callback=print_progress, should_stop=None):
+        flow = FlowSolver(self.teachers, self.exams, seed=self.seed)
+        chromosome = flow.solve_chromosome(should_stop)
+        ga = GeneticAlgorithm(self.teachers, self.exams, seed=self.seed, initial_chromosomes=[chromosome],
+                              **self.ga_options)
+        solution, report = ga.solve(progress_callback, should_stop)
+        report['solver'] = 'hybrid'
+        return solution, report
+
+
+def reject_checkpoints(name, ga_options):
+    # A checkpoint holds a single GA's state, so only the genetic and hybrid solvers can be checkpointed
+    ga_options.pop('checkpoint_every', None)
+    if ga_options.pop('checkpoint_path', None) or ga_options.pop('resume_from', None):
+        raise ValueError(f"The {name} solver doesn't support checkpoints; use the genetic or hybrid solver")
+
+
+def create_solver(name, teachers, exams, seed=None, islands=4, migration_interval=10, migration_size=2,
+                  topology='ring', **ga_options):
+    # Every solver has a `generations` attribute (progress steps) and
+    # solve(progress_callback, should_stop) -> (solution, report); GA options are ignored by the flow solver and
+    # the island settings by every solver but 'island'
+    if name == 'genetic':
+        return GeneticAlgorithm(teachers, exams, seed=seed, **ga_options)
+    if name == 'flow':
+        reject_checkpoints(name, ga_options)
+        return FlowSolver(teachers, exams, seed=seed)
+    if name == 'hybrid':
+        return HybridSolver(teachers, exams, seed=seed, **ga_options)
+    if name == 'weekly':
+        # One GA per ISO week; `workers` spreads the weeks over processes instead of a single GA's evaluations
+        reject_checkpoints(name, ga_options)
+        return WeekDecomposition(teachers, exams, workers=ga_options.pop('workers', 1), seed=seed, **ga_options)
+    if name == 'island':
+        # The islands are the processes, each running a single-process GA
+        ga_options.pop('workers', None)
+        reject_checkpoints(name, ga_options)
+        return IslandModel(teachers, exams, islands=islands, migration_interval=migration_interval,
+                           migration_size=migration_size, topology=topology, seed=seed, **ga_options)
+    raise ValueError(f"Unknown solver: {name}")
@@ -0,0 +1,110 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from BusinessLogic.FitnessState import FitnessState
+from BusinessLogic.GeneticAlgorithm import GeneticAlgorithm
+from BusinessLogic.Instrumentation import Instrumentation
+from BusinessLogic.LocalSearch import LocalSearch
+from BusinessLogic.ProblemInstance import ProblemInstance
+
+
+def _solve_week(teachers, exams, seed, ga_options, instrument):
+    # Returns (solution, best fitness, generations run, metrics records). Records are collected by a local
+    # Instrumentation, since the caller's one (and its open exporters) can't cross a process boundary.
+    instrumentation = Instrumentation() if instrument else None
+    ga = GeneticAlgorithm(teachers, exams, seed=seed, instrumentation=instrumentation, **ga_options)
+    solution, report = ga.evolve(progress_callback=None, return_report=True)
+    records = instrumentation.records if instrumentation is not None else []
+    return solution, report['best_fitness'], report['generations'], records
+
+
+class WeekDecomposition:
+    # Weekly capacity and overlapping exams only involve exams of the same ISO week, so a session splits into
+    # one subproblem per week. Each week is solved by its own GeneticAlgorithm (on a process pool with
+    # workers > 1); a local search over the merged schedule then evens out the teachers' totals across weeks,
+    # the only term that couples the weeks.
+
+    def __init__(self, teachers, exams, workers=1, seed=None, balance_iterations=2000, balance_time=None,
+                 **ga_options):
+        self.teachers = teachers
+        self.exams = exams
+        self.workers = workers
+        self.seed = seed
+        self.balance_iterations = balance_iterations
+        self.balance_time = balance_time
+        # Remaining GeneticAlgorithm settings apply to every week. Instrumentation stays in this process: each
+        # week's records are forwarded to it, tagged with the week, once that week is solved.
+        self.instrumentation = ga_options.pop('instrumentation', None)
+        self.ga_options = ga_options
+        self.problem = ProblemInstance(teachers, exams)
+        self.generations = len(self.problem.weeks)
+
+    def solve_weeks(self, subproblems, seeds):
+        # Yields (week, _solve_week result) as weeks finish; closing the generator cancels the rest
+        instrument = self.instrumentation is not None
+        if self.workers <= 1:
+            for w, exams in enumerate(subproblems):
+                yield w, _solve_week(self.teachers, exams, seeds[w], self.ga_options, instrument)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = {pool.submit(_solve_week, self.teachers, exams, seeds[w], self.ga_options, instrument): w
+                       for w, exams in enumerate(subproblems)}
+            try:
+                for future in as_completed(futures):
+                    yield futures[future], future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def solve(self, progress_callback=None, should_stop=None):
+        # Same (solution, report) result as GeneticAlgorithm.solve; progress is reported once per solved week
+        start = time.perf_counter()
+        problem = self.problem
+        seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(self.seed).spawn(len(problem.weeks))]
+        subproblems = [[self.exams[e] for e in exams] for exams in problem.week_exams]
+
+        solution = {}
+        week_fitness = [None] * len(subproblems)
+        generations = 0
+        cancelled = False
+        weeks = self.solve_weeks(subproblems, seeds)
+        for done, (w, (week_solution, fitness, week_generations, records)) in enumerate(weeks):
+            solution.update(week_solution)
+            week_fitness[w] = fitness
+            generations += week_generations
+            for record in records:
+                self.instrumentation.publish(dict(record, week=int(problem.weeks[w])))
+            if progress_callback is not None:
+                progress_callback(done, fitness, fitness)
+            if should_stop is not None and should_stop():
+                cancelled = True
+                break
+        weeks.close()
+
+        # Coordination pass: balance the merged schedule globally
+        chromosome = problem.encode(solution)
+        merged_fitness = FitnessState(problem, chromosome).score()
+        if not cancelled:
+            search = LocalSearch(problem, np.random.default_rng(seeds[0] if seeds else self.seed),
+                                 self.balance_iterations, self.balance_time)
+            chromosome, fitness = search.polish(chromosome)
+        else:
+            fitness = merged_fitness
+
+        report = {
+            'solver': 'weekly',
+            # Generations actually run, summed over the weeks
+            'generations': generations,
+            'stop_reason': 'cancelled' if cancelled else 'generations',
+            'best_fitness': float(fitness),
+            'best_fitness_history': [float(merged_fitness), float(fitness)],
+            'generation_times': [],
+            'elapsed': time.perf_counter() - start,
+            'cache': None,
+            'week_fitness': week_fitness,
+            'merged_fitness': float(merged_fitness)
+        }
+        return problem.decode(chromosome), report
@@ -0,0 +1,199 @@
+import codecs
+import csv
+import datetime
+
+import numpy as np
+import pandas as pd
+
+TEACHER_NAME_COLUMN = 'Nom Et Prénom'
+TEACHER_COLUMNS = ['Département', 'Grade', 'Cours', 'TD', 'TP', 'coef', 'Nombre de Séances de surveillance']
+TEACHER_NUMERIC_COLUMNS = ['Cours', 'TD', 'TP', 'coef', 'Nombre de Séances de surveillance']
+EXAM_COLUMNS = ['name', 'date', 'time', 'duration', 'supervisors_needed']
+
+DELIMITERS = [',', ';', '\t']
+
+# Encoding and delimiter are sniffed from this many leading bytes only
+SNIFF_SIZE = 64 * 1024
+
+
+def detect_encoding(raw_data):
+    if raw_data.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+
+    # A prefix may end in the middle of a multi-byte character, so decode incrementally
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(raw_data, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        pass
+
+    # chardet is optional: without it, assume Windows-1252 (a superset of latin1 for printable text)
+    try:
+        import chardet
+    except ImportError:
+        return 'cp1252'
+    return chardet.detect(raw_data)['encoding'] or 'cp1252'
+
+
+def detect_delimiter(text):
+    try:
+        return csv.Sniffer().sniff(text, delimiters=''.join(DELIMITERS)).delimiter
+    except csv.Error:
+        # Fall back to the most frequent candidate in the header line
+        header = text.splitlines()[0] if text else ''
+        return max(DELIMITERS, key=header.count)
+
+
+def sniff_csv(filename):
+    # Encoding and delimiter of a CSV file, detected once from a small prefix
+    with open(filename, 'rb') as f:
+        prefix = f.read(SNIFF_SIZE)
+    encoding = detect_encoding(prefix)
+    text = prefix.decode(encoding, errors='ignore')
+    # Only complete lines are fed to the sniffer
+    if len(prefix) == SNIFF_SIZE and '\n' in text:
+        text = text[:text.rindex('\n')]
+    return encoding, detect_delimiter(text)
+
+
+def read_csv(filename):
+    # Single-pass read with the C engine; a file whose tail doesn't match the sniffed encoding is re-read as latin1,
+    # which decodes any byte sequence
+    encoding, delimiter = sniff_csv(filename)
+    try:
+        return pd.read_csv(filename, sep=delimiter, encoding=encoding, engine='c')
+    except UnicodeDecodeError:
+        return pd.read_csv(filename, sep=delimiter, encoding='latin1', engine='c')
+
+
+def normalize_teachers_data(teachers_data):
+    # Assume the first column is the teacher name if the expected header is missing
+    if TEACHER_NAME_COLUMN not in teachers_data.columns and len(teachers_data.columns) > 0:
+        teachers_data = teachers_data.rename(columns={teachers_data.columns[0]: TEACHER_NAME_COLUMN})
+
+    # Create other required columns if missing
+    for col in TEACHER_COLUMNS:
+        if col not in teachers_data.columns:
+            teachers_data[col] = 0
+
+    # Clean up and convert numeric data
+    for col in TEACHER_NUMERIC_COLUMNS:
+        teachers_data[col] = pd.to_numeric(teachers_data[col], errors='coerce').fillna(0)
+
+    return teachers_data
+
+
+def read_teachers_csv(filename):
+    # Returns the normalized teachers DataFrame; raises ValueError if the file can't be parsed
+    try:
+        teachers_data = read_csv(filename)
+    except (pd.errors.ParserError, pd.errors.EmptyDataError) as e:
+        raise ValueError(f"Could not parse the teachers CSV file: {e}")
+    return normalize_teachers_data(teachers_data)
+
+
+def sample_teachers_data(count=28):
+    return pd.DataFrame([
+        {TEACHER_NAME_COLUMN: f'Enseignant {i + 1}',
+         'Département': '1-INFORMATIQUE',
+         'Grade': 'Ass / Vac',
+         'Cours': 0, 'TD': 0, 'TP': 3, 'coef': 0,
+         'Nombre de Séances de surveillance': 1}
+        for i in range(count)
+    ])
+
+
+def prepare_teachers(teachers_data):
+    # Teacher records as consumed by GeneticAlgorithm and the exporters
+    if teachers_data is None:
+        return []
+
+    count = len(teachers_data)
+
+    def column(name, default):
+        return teachers_data[name].tolist() if name in teachers_data.columns else [default] * count
+
+    capacities = column('Nombre de Séances de surveillance', 0)
+    return [{
+        'id': teacher_id,
+        'name': name,
+        'department': department,
+        'grade': grade,
+        'supervision_capacity': int(capacity)
+    } for teacher_id, name, department, grade, capacity in zip(
+        teachers_data.index.tolist(), teachers_data[TEACHER_NAME_COLUMN].tolist(),
+        column('Département', ''), column('Grade', ''), capacities)]
+
+
+def create_exam(exam_id, name, date_str, time_str, duration, supervisors_needed):
+    # Raises ValueError on malformed dates, times or numbers
+    date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+    time_obj = datetime.datetime.strptime(time_str, "%H:%M").time()
+
+    return {
+        'id': exam_id,
+        'name': name,
+        'date': datetime.datetime.combine(date_obj, time_obj),
+        'duration': float(duration),
+        'supervisors_needed': int(supervisors_needed),
+        'assigned_teachers': []  # Will be filled by the algorithm
+    }
+
+
+def read_exams_csv(filename, start_id=0):
+    # Returns (exams, errors): the valid exams numbered from start_id, and one
+    # {'row': line number, 'error': message} entry per skipped row.
+    # Raises ValueError if the file can't be parsed or lacks the required columns.
+    try:
+        exams_data = read_csv(filename)
+    except (pd.errors.ParserError, pd.errors.EmptyDataError) as e:
+        raise ValueError(f"Could not parse the exams CSV file: {e}")
+
+    exams_data.columns = [str(col).strip() for col in exams_data.columns]
+    if not all(col in exams_data.columns for col in EXAM_COLUMNS):
+        raise ValueError("Could not import exams from the CSV file. Please check the format.")
+
+    # Vectorized parsing: invalid values become NaN / NaT and are reported below
+    names = exams_data['name'].astype(str).str.strip()
+    dates = pd.to_datetime(exams_data['date'].astype(str).str.strip() + ' ' +
+                           exams_data['time'].astype(str).str.strip(),
+                           format="%Y-%m-%d %H:%M", errors='coerce')
+    durations = pd.to_numeric(exams_data['duration'], errors='coerce')
+    supervisors = pd.to_numeric(exams_data['supervisors_needed'], errors='coerce')
+
+    problems = {
+        'invalid date or time': dates.isna(),
+        'invalid duration': durations.isna(),
+        'invalid supervisors_needed': supervisors.isna() | np.isinf(supervisors)
+    }
+    valid = ~np.logical_or.reduce([mask.to_numpy() for mask in problems.values()])
+
+    errors = []
+    for message, mask in problems.items():
+        # Line numbers count the header as line 1
+        errors.extend({'row': int(i) + 2, 'error': message} for i in np.flatnonzero(mask.to_numpy()))
+    errors.sort(key=lambda error: error['row'])
+
+    exams = [{
+        'id': exam_id,
+        'name': name,
+        'date': date,
+        'duration': duration,
+        'supervisors_needed': supervisors_needed,
+        'assigned_teachers': []  # Will be filled by the algorithm
+    } for exam_id, name, date, duration, supervisors_needed in zip(
+        range(start_id, start_id + int(valid.sum())),
+        names[valid].tolist(),
+        dates[valid].dt.to_pydatetime().tolist(),
+        durations[valid].astype(float).tolist(),
+        supervisors[valid].astype(np.int64).tolist())]
+
+    return exams, errors
+
+
+def format_errors(errors, limit=10):
+    # Human-readable summary of read_exams_csv errors
+    lines = [f"Row {error['row']}: {error['error']}" for error in errors[:limit]]
+    if len(errors) > limit:
+        lines.append(f"... and {len(errors) - limit} more")
+    return "\n".join(lines)
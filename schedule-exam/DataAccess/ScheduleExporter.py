@@ -0,0 +1,178 @@
+import csv
+import json
+import os
+from collections import Counter
+
+import pandas as pd
+
+SCHEDULE_COLUMNS = ['Exam', 'Date', 'Time', 'Duration', 'Teacher', 'Department', 'Grade', 'Supervision Capacity']
+EXPORT_FORMATS = ('csv', 'jsonl', 'parquet', 'feather', 'timetable')
+# Rows per record batch in the Parquet and Feather writers
+BATCH_ROWS = 10000
+
+
+def text(value):
+    # Blank spreadsheet cells come in as NaN; export them as empty text like pandas did, anything else as str
+    return '' if value != value else str(value)
+
+
+def schedule_rows(exams, teachers):
+    # One row per (exam, assigned teacher) in the export format; text columns are always str
+    teacher_dict = {t['id']: t for t in teachers}
+
+    for exam in exams:
+        exam_date = exam['date']
+        for teacher_id in exam.get('assigned_teachers', []):
+            if teacher_id in teacher_dict:
+                teacher = teacher_dict[teacher_id]
+                yield {
+                    'Exam': text(exam['name']),
+                    'Date': exam_date.strftime("%Y-%m-%d"),
+                    'Time': exam_date.strftime("%H:%M"),
+                    'Duration': exam['duration'],
+                    'Teacher': text(teacher['name']),
+                    'Department': text(teacher['department']),
+                    'Grade': text(teacher['grade']),
+                    'Supervision Capacity': teacher['supervision_capacity']
+                }
+
+
+def assignment_details(exams, teachers):
+    # (exam, date, time, week, teacher, department, weekly supervisions, capacity) rows for the details view.
+    # Per-teacher-per-week counts are taken in one pass over the assignments instead of per row. Names and
+    # departments are always text so the view can sort and filter them.
+    teacher_dict = {t['id']: t for t in teachers}
+    weekly_counts = Counter((teacher_id, exam['date'].isocalendar()[1])
+                            for exam in exams for teacher_id in exam.get('assigned_teachers', []))
+
+    return [(exam['name'],
+             exam['date'].strftime("%Y-%m-%d"),
+             exam['date'].strftime("%H:%M"),
+             exam['date'].isocalendar()[1],
+             text(teacher_dict[teacher_id]['name']),
+             text(teacher_dict[teacher_id]['department']),
+             weekly_counts[(teacher_id, exam['date'].isocalendar()[1])],
+             teacher_dict[teacher_id]['supervision_capacity'])
+            for exam in exams for teacher_id in exam.get('assigned_teachers', []) if teacher_id in teacher_dict]
+
+
+def export_schedule_csv(filename, exams, teachers):
+    # Rows are written as they are produced, so the schedule is never held in memory as a table
+    with open(filename, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=SCHEDULE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(schedule_rows(exams, teachers))
+
+
+def export_schedule_jsonl(filename, exams, teachers):
+    with open(filename, 'w', encoding='utf-8') as f:
+        for row in schedule_rows(exams, teachers):
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def arrow_batches(exams, teachers):
+    # pyarrow is optional: only the Parquet and Feather exports need it
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ValueError("Parquet and Feather export need the pyarrow package") from None
+
+    schema = pa.schema([('Exam', pa.string()), ('Date', pa.string()), ('Time', pa.string()),
+                        ('Duration', pa.float64()), ('Teacher', pa.string()), ('Department', pa.string()),
+                        ('Grade', pa.string()), ('Supervision Capacity', pa.int64())])
+
+    def batches():
+        batch = []
+        for row in schedule_rows(exams, teachers):
+            batch.append(row)
+            if len(batch) == BATCH_ROWS:
+                yield pa.RecordBatch.from_pylist(batch, schema=schema)
+                batch = []
+        if batch:
+            yield pa.RecordBatch.from_pylist(batch, schema=schema)
+
+    return pa, schema, batches()
+
+
+def export_schedule_parquet(filename, exams, teachers):
+    pa, schema, batches = arrow_batches(exams, teachers)
+    import pyarrow.parquet as pq
+
+    with pq.ParquetWriter(filename, schema, compression='zstd') as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+
+
+def export_schedule_feather(filename, exams, teachers):
+    # Feather v2 is the Arrow IPC file format, written one record batch at a time
+    pa, schema, batches = arrow_batches(exams, teachers)
+    options = pa.ipc.IpcWriteOptions(compression='lz4')
+    with pa.ipc.new_file(filename, schema, options=options) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+
+
+def export_teacher_timetable(filename, exams, teachers):
+    # Pivot: one row per teacher, one column per exam date and time, holding the exam they supervise then
+    # (exams sharing a time are joined with "; "), plus their total number of supervisions
+    slot_names = {}
+    cells = {}
+    for exam in sorted(exams, key=lambda exam: exam['date']):
+        slot = slot_names.setdefault(exam['date'], exam['date'].strftime("%Y-%m-%d %H:%M"))
+        for teacher_id in exam.get('assigned_teachers', []):
+            cells.setdefault(teacher_id, {}).setdefault(slot, []).append(text(exam['name']))
+
+    slots = list(slot_names.values())
+    with open(filename, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Teacher', 'Department'] + slots + ['Total'])
+        for teacher in teachers:
+            duties = cells.get(teacher['id'], {})
+            writer.writerow([text(teacher['name']), text(teacher['department'])] +
+                            ["; ".join(duties.get(slot, [])) for slot in slots] +
+                            [sum(len(names) for names in duties.values())])
+
+
+EXPORTERS = {
+    'csv': export_schedule_csv,
+    'jsonl': export_schedule_jsonl,
+    'parquet': export_schedule_parquet,
+    'feather': export_schedule_feather,
+    'timetable': export_teacher_timetable
+}
+
+
+def format_for(filename):
+    # Export format from the file extension; unknown extensions get CSV
+    extension = os.path.splitext(filename)[1].lower().lstrip('.')
+    extension = {'json': 'jsonl', 'ndjson': 'jsonl', 'arrow': 'feather'}.get(extension, extension)
+    return extension if extension in EXPORTERS else 'csv'
+
+
+def export_schedule(filename, exams, teachers, export_format=None):
+    # export_format is one of EXPORT_FORMATS, by default picked from the file extension
+    EXPORTERS[export_format or format_for(filename)](filename, exams, teachers)
+
+
+def read_schedule_csv(filename, exams, teachers):
+    # Read a schedule written by export_schedule_csv back into a {exam_id: [teacher_id, ...]} solution.
+    # Exams are matched by name, date and time, teachers by name; rows matching neither are ignored.
+    df = pd.read_csv(filename, encoding='utf-8', dtype=str)
+    exam_keys = {(exam['name'], exam['date'].strftime("%Y-%m-%d"), exam['date'].strftime("%H:%M")): exam['id']
+                 for exam in exams}
+    teacher_ids = {teacher['name']: teacher['id'] for teacher in teachers}
+
+    solution = {}
+    for name, date, time, teacher in zip(df['Exam'], df['Date'], df['Time'], df['Teacher']):
+        exam_id = exam_keys.get((name, date, time))
+        if exam_id is not None and teacher in teacher_ids:
+            solution.setdefault(exam_id, []).append(teacher_ids[teacher])
+    return solution
+
+
+def apply_solution(exams, solution):
+    # Write a {exam_id: [teacher_id, ...]} solution back onto the exam records
+    exams_by_id = {exam['id']: exam for exam in exams}
+    for exam_id, assigned_teachers in solution.items():
+        if exam_id in exams_by_id:
+            exams_by_id[exam_id]['assigned_teachers'] = assigned_teachers
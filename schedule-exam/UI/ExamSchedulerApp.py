@@ -1,5 +1,6 @@
-import pandas as pd
 import datetime
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from matplotlib.figure import Figure
@@ -7,7 +8,10 @@ from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import matplotlib.dates as mdates
 import io
 
-from BusinessLogic.GeneticAlgorithm import GeneticAlgorithm
+from BusinessLogic.Reoptimizer import Reoptimizer
+from BusinessLogic.Solvers import SOLVERS, create_solver
+from DataAccess import DataLoader, ScheduleExporter
+from UI.PagedTreeview import PagedTreeview
 
 
 class ExamSchedulerApp:
@@ -18,9 +22,17 @@ class ExamSchedulerApp:
         self.root.configure(bg="#f5f5f5")
 
         self.teachers_data = None
+        # Teacher records derived from teachers_data, built on first use and dropped when it changes
+        self.teachers = None
         self.exams = []
         self.current_schedule = None
 
+        # Background optimization run: worker thread, progress queue and cancel flag
+        self.optimization_thread = None
+        self.optimization_generations = 0
+        self.optimization_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+
         self.create_ui()
 
     def create_ui(self):
@@ -41,10 +53,10 @@ class ExamSchedulerApp:
 
         ttk.Label(top_frame, text="Exam Scheduler", style='Header.TLabel').pack(side=tk.LEFT, padx=5)
         # Add this after the import_btn line in the top_frame section
-        import_exams_btn = ttk.Button(top_frame, text="Import Exams CSV", command=self.import_exams_csv)
-        import_exams_btn.pack(side=tk.RIGHT, padx=5)
-        import_btn = ttk.Button(top_frame, text="Import Teachers CSV", command=self.import_csv)
-        import_btn.pack(side=tk.RIGHT, padx=5)
+        self.import_exams_btn = ttk.Button(top_frame, text="Import Exams CSV", command=self.import_exams_csv)
+        self.import_exams_btn.pack(side=tk.RIGHT, padx=5)
+        self.import_btn = ttk.Button(top_frame, text="Import Teachers CSV", command=self.import_csv)
+        self.import_btn.pack(side=tk.RIGHT, padx=5)
 
         # Middle section: Split into two parts
         middle_frame = ttk.Frame(main_frame)
@@ -88,26 +100,10 @@ class ExamSchedulerApp:
         # Exam list
         ttk.Label(left_frame, text="Scheduled Exams:").pack(anchor=tk.W, pady=(10, 5))
 
-        exam_list_frame = ttk.Frame(left_frame)
-        exam_list_frame.pack(fill=tk.BOTH, expand=True)
-
-        self.exam_tree = ttk.Treeview(exam_list_frame, columns=("Name", "Date", "Time", "Supervisors"), show="headings",
-                                      height=10)
-        self.exam_tree.heading("Name", text="Name")
-        self.exam_tree.heading("Date", text="Date")
-        self.exam_tree.heading("Time", text="Time")
-        self.exam_tree.heading("Supervisors", text="Supervisors")
-
-        self.exam_tree.column("Name", width=150)
-        self.exam_tree.column("Date", width=100)
-        self.exam_tree.column("Time", width=100)
-        self.exam_tree.column("Supervisors", width=80)
-
-        self.exam_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-
-        scrollbar = ttk.Scrollbar(exam_list_frame, orient=tk.VERTICAL, command=self.exam_tree.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.exam_tree.configure(yscrollcommand=scrollbar.set)
+        # Paged: only the visible page of exams is materialized in the widget
+        self.exam_tree = PagedTreeview(left_frame, ("Name", "Date", "Time", "Supervisors"),
+                                       widths={"Name": 150, "Supervisors": 80})
+        self.exam_tree.pack(fill=tk.BOTH, expand=True)
 
         # Right side: Schedule visualization and optimization
         right_frame = ttk.LabelFrame(middle_frame, text="Schedule Visualization", padding=10)
@@ -124,14 +120,34 @@ class ExamSchedulerApp:
         bottom_frame = ttk.Frame(main_frame)
         bottom_frame.pack(fill=tk.X, pady=(20, 0))
 
-        optimize_btn = ttk.Button(bottom_frame, text="Generate Optimal Schedule", command=self.optimize_schedule)
-        optimize_btn.pack(side=tk.LEFT, padx=5)
+        self.optimize_btn = ttk.Button(bottom_frame, text="Generate Optimal Schedule",
+                                       command=self.optimize_schedule)
+        self.optimize_btn.pack(side=tk.LEFT, padx=5)
+
+        self.reoptimize_btn = ttk.Button(bottom_frame, text="Re-optimize Changes",
+                                         command=self.reoptimize_schedule)
+        self.reoptimize_btn.pack(side=tk.LEFT, padx=5)
+
+        ttk.Label(bottom_frame, text="Solver:").pack(side=tk.LEFT, padx=(5, 0))
+        self.solver_var = tk.StringVar(value=SOLVERS[0])
+        ttk.Combobox(bottom_frame, textvariable=self.solver_var, values=SOLVERS, state='readonly',
+                     width=8).pack(side=tk.LEFT, padx=5)
+
+        self.cancel_btn = ttk.Button(bottom_frame, text="Cancel", command=self.cancel_optimization,
+                                     state=tk.DISABLED)
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
+
+        self.progress_bar = ttk.Progressbar(bottom_frame, mode='determinate', length=200)
+        self.progress_bar.pack(side=tk.LEFT, padx=5)
 
         export_btn = ttk.Button(bottom_frame, text="Export Schedule", command=self.export_schedule)
         export_btn.pack(side=tk.LEFT, padx=5)
 
-        clear_btn = ttk.Button(bottom_frame, text="Clear All", command=self.clear_all)
-        clear_btn.pack(side=tk.RIGHT, padx=5)
+        timetable_btn = ttk.Button(bottom_frame, text="Export Timetable", command=self.export_timetable)
+        timetable_btn.pack(side=tk.LEFT, padx=5)
+
+        self.clear_btn = ttk.Button(bottom_frame, text="Clear All", command=self.clear_all)
+        self.clear_btn.pack(side=tk.RIGHT, padx=5)
 
         # Status bar
         self.status_var = tk.StringVar()
@@ -149,77 +165,26 @@ class ExamSchedulerApp:
             return
 
         try:
-            # Try different encodings and delimiters
-            encodings = ['utf-8', 'latin1', 'cp1252', 'iso-8859-1', 'utf-8-sig']
-            delimiters = [',', ';', '\t']
-
-            success = False
-
-            for encoding in encodings:
-                if success:
-                    break
-
-                for delimiter in delimiters:
-                    try:
-                        exams_data = pd.read_csv(filename, sep=delimiter, encoding=encoding)
-
-                        # Check if the dataframe has the required columns
-                        required_cols = ['name', 'date', 'time', 'duration', 'supervisors_needed']
-                        if not all(col in exams_data.columns for col in required_cols):
-                            continue
-
-                        # Process the exams
-                        for _, row in exams_data.iterrows():
-                            try:
-                                name = str(row['name']).strip()
-                                date_str = str(row['date']).strip()
-                                time_str = str(row['time']).strip()
-                                duration = float(row['duration'])
-                                supervisors_needed = int(row['supervisors_needed'])
-
-                                # Parse date and time
-                                date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                                time_obj = datetime.datetime.strptime(time_str, "%H:%M").time()
-                                datetime_obj = datetime.datetime.combine(date_obj, time_obj)
-
-                                # Create exam object
-                                exam = {
-                                    'id': len(self.exams),
-                                    'name': name,
-                                    'date': datetime_obj,
-                                    'duration': duration,
-                                    'supervisors_needed': supervisors_needed,
-                                    'assigned_teachers': []
-                                }
-
-                                self.exams.append(exam)
-
-                                # Update UI
-                                self.exam_tree.insert("", tk.END, values=(
-                                    name,
-                                    date_obj.strftime("%Y-%m-%d"),
-                                    time_obj.strftime("%H:%M"),
-                                    supervisors_needed
-                                ))
-                            except Exception as e:
-                                print(f"Error processing exam row: {e}")
-                                continue
-
-                        # Update status and visualization
-                        self.status_var.set(f"Imported {len(exams_data)} exams from {filename}")
-                        self.update_visualization()
-                        success = True
-                        break
-
-                    except Exception as e:
-                        continue
-
-            if not success:
-                messagebox.showerror("Import Error",
-                                     "Could not import exams from the CSV file. Please check the format.")
-
+            exams, errors = DataLoader.read_exams_csv(filename, start_id=len(self.exams))
+        except ValueError as e:
+            messagebox.showerror("Import Error", str(e))
+            return
         except Exception as e:
             messagebox.showerror("Import Error", f"Error importing exams: {str(e)}")
+            return
+
+        self.exams.extend(exams)
+
+        # Update UI
+        self.exam_tree.append_rows(self.exam_row(exam) for exam in exams)
+
+        # Update status and visualization
+        self.status_var.set(f"Imported {len(exams)} exams from {filename}")
+        self.update_visualization()
+
+        if errors:
+            messagebox.showwarning("Import Warning",
+                                   f"Skipped {len(errors)} invalid rows:\n\n{DataLoader.format_errors(errors)}")
 
     def import_csv(self):
         filename = filedialog.askopenfilename(
@@ -231,103 +196,38 @@ class ExamSchedulerApp:
             return
 
         try:
-            # First, read the file as text to determine the actual structure
-            with open(filename, 'rb') as f:
-                # Try to detect the encoding
-                import chardet
-                raw_data = f.read()
-                result = chardet.detect(raw_data)
-                detected_encoding = result['encoding']
-
-                self.status_var.set(f"Detected encoding: {detected_encoding}")
-
-                # Try to read with the detected encoding
-                try:
-                    # Check for different delimiters
-                    for delimiter in [',', ';', '\t']:
-                        try:
-                            self.teachers_data = pd.read_csv(
-                                filename,
-                                sep=delimiter,
-                                encoding=detected_encoding,
-                                engine='python'  # More flexible parsing
-                            )
-
-                            # If successful, process the data
-                            if 'Nom Et Prénom' not in self.teachers_data.columns:
-                                # Try with alternate column names or assume first column is name
-                                if len(self.teachers_data.columns) > 0:
-                                    self.teachers_data.rename(columns={self.teachers_data.columns[0]: 'Nom Et Prénom'},
-                                                              inplace=True)
-
-                            # Create other required columns if missing
-                            required_cols = ['Département', 'Grade', 'Cours', 'TD', 'TP', 'coef',
-                                             'Nombre de Séances de surveillance']
-                            for col in required_cols:
-                                if col not in self.teachers_data.columns:
-                                    self.teachers_data[col] = 0
-
-                            # Clean up and convert numeric data
-                            for col in ['Cours', 'TD', 'TP', 'coef', 'Nombre de Séances de surveillance']:
-                                self.teachers_data[col] = pd.to_numeric(self.teachers_data[col],
-                                                                        errors='coerce').fillna(0)
-
-                            self.status_var.set(f"Imported {len(self.teachers_data)} teachers from {filename}")
-                            return
-                        except:
-                            continue
-
-                    messagebox.showerror("Import Error", "Could not determine the correct delimiter for this CSV file.")
-                    return
-                except Exception as e:
-                    messagebox.showerror("Import Error", f"Error with {detected_encoding} encoding: {str(e)}")
-                    return
-        except Exception as e:
-            # If all else fails, try a direct approach
-            try:
-                # Try a simple approach with a flexible engine
-                self.teachers_data = pd.DataFrame([
-                    {'Nom Et Prénom': f'Enseignant {i + 1}',
-                     'Département': '1-INFORMATIQUE',
-                     'Grade': 'Ass / Vac',
-                     'Cours': 0, 'TD': 0, 'TP': 3, 'coef': 0,
-                     'Nombre de Séances de surveillance': 1}
-                    for i in range(28)
-                ])
-
-                self.status_var.set("Created sample data (CSV import failed)")
-
-                # Create a message suggesting to fix the CSV
-                messagebox.showinfo(
-                    "Using Sample Data",
-                    "Importing the CSV failed. Using sample data instead.\n\n"
-                    "To fix your CSV file, try:\n"
-                    "1. Opening it in Excel\n"
-                    "2. Saving as CSV (comma delimited)\n"
-                    "3. Ensuring column names match expected format"
-                )
-                return
-            except Exception as final_e:
-                messagebox.showerror("Import Error", f"Final error: {str(final_e)}")
-                return
+            self.set_teachers_data(DataLoader.read_teachers_csv(filename))
+            self.status_var.set(f"Imported {len(self.teachers_data)} teachers from {filename}")
+        except ValueError as e:
+            messagebox.showerror("Import Error", str(e))
+        except Exception:
+            # If all else fails, fall back to sample data
+            self.set_teachers_data(DataLoader.sample_teachers_data())
+
+            self.status_var.set("Created sample data (CSV import failed)")
+
+            # Create a message suggesting to fix the CSV
+            messagebox.showinfo(
+                "Using Sample Data",
+                "Importing the CSV failed. Using sample data instead.\n\n"
+                "To fix your CSV file, try:\n"
+                "1. Opening it in Excel\n"
+                "2. Saving as CSV (comma delimited)\n"
+                "3. Ensuring column names match expected format"
+            )
+
+    def set_teachers_data(self, teachers_data):
+        self.teachers_data = teachers_data
+        self.teachers = None
 
     def prepare_teachers_data(self):
-        if self.teachers_data is None:
-            return []
-
-        teachers = []
-        for idx, row in self.teachers_data.iterrows():
-            teacher = {
-                'id': idx,
-                'name': row['Nom Et Prénom'],
-                'department': row['Département'] if 'Département' in row else '',
-                'grade': row['Grade'] if 'Grade' in row else '',
-                'supervision_capacity': int(
-                    row['Nombre de Séances de surveillance']) if 'Nombre de Séances de surveillance' in row else 0
-            }
-            teachers.append(teacher)
-
-        return teachers
+        if self.teachers is None:
+            self.teachers = DataLoader.prepare_teachers(self.teachers_data)
+        return self.teachers
+
+    def exam_row(self, exam):
+        return (exam['name'], exam['date'].strftime("%Y-%m-%d"), exam['date'].strftime("%H:%M"),
+                exam['supervisors_needed'])
 
     def add_exam(self):
         try:
@@ -341,32 +241,13 @@ class ExamSchedulerApp:
                 messagebox.showwarning("Missing Information", "All fields are required")
                 return
 
-            # Parse date and time
-            date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-            time_obj = datetime.datetime.strptime(time_str, "%H:%M").time()
-            datetime_obj = datetime.datetime.combine(date_obj, time_obj)
-            duration = float(duration_str)
-            supervisors_needed = int(supervisors_str)
-
             # Create exam object
-            exam = {
-                'id': len(self.exams),
-                'name': name,
-                'date': datetime_obj,
-                'duration': duration,
-                'supervisors_needed': supervisors_needed,
-                'assigned_teachers': []  # Will be filled by the algorithm
-            }
+            exam = DataLoader.create_exam(len(self.exams), name, date_str, time_str, duration_str, supervisors_str)
 
             self.exams.append(exam)
 
             # Update UI
-            self.exam_tree.insert("", tk.END, values=(
-                name,
-                date_obj.strftime("%Y-%m-%d"),
-                time_obj.strftime("%H:%M"),
-                supervisors_needed
-            ))
+            self.exam_tree.append_rows([self.exam_row(exam)])
 
             # Clear form
             self.exam_name_var.set("")
@@ -396,17 +277,89 @@ class ExamSchedulerApp:
         # Prepare teachers data
         teachers = self.prepare_teachers_data()
 
-        # Run genetic algorithm
-        self.status_var.set("Optimizing schedule... This may take a moment.")
-        self.root.update()
+        # The worker gets its own copy of the exam list so edits made during the run can't affect it
+        self.start_optimization(create_solver(self.solver_var.get(), teachers, list(self.exams)),
+                                "Optimizing schedule... This may take a moment.")
 
-        ga = GeneticAlgorithm(teachers, self.exams)
-        best_solution = ga.evolve()
+    def reoptimize_schedule(self):
+        # Repair the current schedule after exams were added or teachers changed, keeping unaffected
+        # assignments in place
+        if not self.current_schedule:
+            messagebox.showwarning("No Schedule", "Please generate a schedule first")
+            return
 
-        # Apply solution to exams
-        for exam_id, assigned_teachers in best_solution.items():
-            exam = next(e for e in self.exams if e['id'] == exam_id)
-            exam['assigned_teachers'] = assigned_teachers
+        if self.teachers_data is None:
+            messagebox.showwarning("No Teachers", "Please import teachers data first")
+            return
+
+        solver = Reoptimizer(self.prepare_teachers_data(), list(self.exams), dict(self.current_schedule))
+        self.start_optimization(solver, "Re-optimizing the changed exams...")
+
+    def start_optimization(self, solver, message):
+        # Run the solver in the background; the UI polls its progress with root.after
+        self.status_var.set(message)
+        self.set_running(True)
+        self.cancel_event.clear()
+
+        self.optimization_generations = solver.generations
+        self.progress_bar.configure(maximum=solver.generations, value=0)
+        self.optimization_thread = threading.Thread(target=self.run_optimization, args=(solver,), daemon=True)
+        self.optimization_thread.start()
+        self.root.after(100, self.poll_optimization)
+
+    def set_running(self, running):
+        # Importing or clearing during a run would replace the exams and teachers the result refers to (ids are
+        # list positions and DataFrame indices), so those buttons are disabled until the run ends
+        state = tk.DISABLED if running else tk.NORMAL
+        for button in (self.optimize_btn, self.reoptimize_btn, self.import_btn, self.import_exams_btn,
+                       self.clear_btn):
+            button.configure(state=state)
+        self.cancel_btn.configure(state=tk.NORMAL if running else tk.DISABLED)
+
+    def run_optimization(self, solver):
+        # Worker thread: never touches Tk widgets, only posts messages to the queue
+        try:
+            result = solver.solve(
+                progress_callback=lambda generation, best, avg: self.optimization_queue.put(
+                    ('progress', (generation, best, avg))),
+                should_stop=self.cancel_event.is_set)
+            self.optimization_queue.put(('done', result))
+        except Exception as e:
+            self.optimization_queue.put(('error', e))
+
+    def poll_optimization(self):
+        while True:
+            try:
+                kind, payload = self.optimization_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'progress':
+                generation, best_fitness, avg_fitness = payload
+                self.progress_bar.configure(value=generation + 1)
+                self.status_var.set(f"Optimizing... generation {generation + 1}/{self.optimization_generations}: "
+                                    f"best fitness {best_fitness:.2f}, average {avg_fitness:.2f}")
+            elif kind == 'done':
+                self.finish_optimization(*payload)
+                return
+            else:
+                self.set_running(False)
+                self.status_var.set("Schedule optimization failed")
+                messagebox.showerror("Optimization Error", f"Error optimizing schedule: {str(payload)}")
+                return
+
+        self.root.after(100, self.poll_optimization)
+
+    def cancel_optimization(self):
+        self.cancel_event.set()
+        self.cancel_btn.configure(state=tk.DISABLED)
+        self.status_var.set("Cancelling... keeping the best schedule found so far")
+
+    def finish_optimization(self, best_solution, report):
+        self.set_running(False)
+
+        # Apply solution to exams (exams added while the run was in progress keep no assignment)
+        ScheduleExporter.apply_solution(self.exams, best_solution)
 
         self.current_schedule = best_solution
 
@@ -414,7 +367,16 @@ class ExamSchedulerApp:
         self.update_visualization()
 
         # Update status
-        self.status_var.set("Schedule optimization complete")
+        if report['solver'] == 'reoptimize':
+            self.status_var.set(f"Re-optimized {report['movable_exams']} exams in {report['elapsed']:.1f}s, "
+                                f"{report['changed_assignments']} published assignments changed, "
+                                f"best fitness {report['best_fitness']:.2f}")
+        elif report['stop_reason'] == 'cancelled':
+            self.status_var.set(f"Schedule optimization cancelled after {report['generations']} generations, "
+                                f"best schedule so far applied")
+        else:
+            self.status_var.set(f"Schedule optimization complete ({report['generations']} generations, "
+                                f"{report['elapsed']:.1f}s, best fitness {report['best_fitness']:.2f})")
 
         # Show detailed assignment
         self.show_assignment_details()
@@ -469,48 +431,38 @@ class ExamSchedulerApp:
         frame = ttk.Frame(details_window, padding=10)
         frame.pack(fill=tk.BOTH, expand=True)
 
-        # Create treeview
-        columns = ("Exam", "Date", "Time", "Teacher", "Department", "Weekly Supervisions")
-        tree = ttk.Treeview(frame, columns=columns, show="headings")
-
-        for col in columns:
-            tree.heading(col, text=col)
-            tree.column(col, width=100)
-
-        # Get teacher details
-        teachers = self.prepare_teachers_data()
-        teacher_dict = {t['id']: t for t in teachers}
-
-        # Add data
-        for exam in self.exams:
-            exam_date = exam['date']
-            week_num = exam_date.isocalendar()[1]
-
-            for teacher_id in exam.get('assigned_teachers', []):
-                if teacher_id in teacher_dict:
-                    teacher = teacher_dict[teacher_id]
-
-                    # Count weekly supervisions for this teacher
-                    weekly_count = sum(1 for e in self.exams
-                                       if e['date'].isocalendar()[1] == week_num
-                                       and teacher_id in e.get('assigned_teachers', []))
-
-                    tree.insert("", tk.END, values=(
-                        exam['name'],
-                        exam_date.strftime("%Y-%m-%d"),
-                        exam_date.strftime("%H:%M"),
-                        teacher['name'],
-                        teacher['department'],
-                        f"{weekly_count}/{teacher['supervision_capacity']}"
-                    ))
-
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscrollcommand=scrollbar.set)
-
-        # Pack everything
-        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Rows and per-teacher-per-week counts are built in one pass; the view only materializes one page
+        rows = ScheduleExporter.assignment_details(self.exams, self.prepare_teachers_data())
+        columns = ("Exam", "Date", "Time", "Week", "Teacher", "Department", "Weekly Supervisions", "Capacity")
+        tree = PagedTreeview(frame, columns, widths={"Week": 60, "Weekly Supervisions": 130, "Capacity": 70})
+
+        # Filters
+        filter_frame = ttk.Frame(frame)
+        filter_frame.pack(fill=tk.X, pady=(0, 5))
+
+        ttk.Label(filter_frame, text="Teacher:").pack(side=tk.LEFT)
+        teacher_var = tk.StringVar()
+        teacher_var.trace_add('write', lambda *_: tree.set_filter("Teacher", teacher_var.get().strip()))
+        ttk.Entry(filter_frame, textvariable=teacher_var, width=20).pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Label(filter_frame, text="Department:").pack(side=tk.LEFT)
+        department_var = tk.StringVar()
+        department_box = ttk.Combobox(filter_frame, textvariable=department_var, state='readonly', width=25,
+                                      values=[""] + sorted({row[5] for row in rows} - {""}))
+        department_box.bind('<<ComboboxSelected>>',
+                            lambda _: tree.set_filter("Department", department_var.get(), exact=True))
+        department_box.pack(side=tk.LEFT, padx=(0, 10))
+
+        ttk.Label(filter_frame, text="Week:").pack(side=tk.LEFT)
+        week_var = tk.StringVar()
+        week_box = ttk.Combobox(filter_frame, textvariable=week_var, state='readonly', width=6,
+                                values=[""] + sorted({row[3] for row in rows}))
+        week_box.bind('<<ComboboxSelected>>',
+                      lambda _: tree.set_filter("Week", int(week_var.get()) if week_var.get() else None))
+        week_box.pack(side=tk.LEFT)
+
+        tree.pack(fill=tk.BOTH, expand=True)
+        tree.set_rows(rows)
 
         # Add close button
         close_btn = ttk.Button(details_window, text="Close", command=details_window.destroy)
@@ -524,52 +476,49 @@ class ExamSchedulerApp:
         filename = filedialog.asksaveasfilename(
             title="Export Schedule",
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+            filetypes=[("CSV files", "*.csv"), ("JSON lines", "*.jsonl"), ("Parquet", "*.parquet"),
+                       ("Feather", "*.feather"), ("All files", "*.*")]
         )
 
         if not filename:
             return
 
         try:
-            # Prepare data for export
-            export_data = []
-            teachers = self.prepare_teachers_data()
-            teacher_dict = {t['id']: t for t in teachers}
-
-            for exam in self.exams:
-                exam_date = exam['date']
-                for teacher_id in exam.get('assigned_teachers', []):
-                    if teacher_id in teacher_dict:
-                        teacher = teacher_dict[teacher_id]
-                        export_data.append({
-                            'Exam': exam['name'],
-                            'Date': exam_date.strftime("%Y-%m-%d"),
-                            'Time': exam_date.strftime("%H:%M"),
-                            'Duration': exam['duration'],
-                            'Teacher': teacher['name'],
-                            'Department': teacher['department'],
-                            'Grade': teacher['grade'],
-                            'Supervision Capacity': teacher['supervision_capacity']
-                        })
-
-            # Create DataFrame and export
-            df = pd.DataFrame(export_data)
-            df.to_csv(filename, index=False, encoding='utf-8')
-
+            ScheduleExporter.export_schedule(filename, self.exams, self.prepare_teachers_data())
             self.status_var.set(f"Schedule exported to {filename}")
 
         except Exception as e:
             messagebox.showerror("Export Error", f"Error exporting schedule: {str(e)}")
 
+    def export_timetable(self):
+        if not self.current_schedule:
+            messagebox.showwarning("No Schedule", "Please generate a schedule first")
+            return
+
+        filename = filedialog.asksaveasfilename(
+            title="Export Teacher Timetable",
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+
+        if not filename:
+            return
+
+        try:
+            ScheduleExporter.export_teacher_timetable(filename, self.exams, self.prepare_teachers_data())
+            self.status_var.set(f"Teacher timetable exported to {filename}")
+
+        except Exception as e:
+            messagebox.showerror("Export Error", f"Error exporting timetable: {str(e)}")
+
     def clear_all(self):
         if messagebox.askyesno("Clear All", "Are you sure you want to clear all data?"):
-            self.teachers_data = None
+            self.set_teachers_data(None)
             self.exams = []
             self.current_schedule = None
 
             # Clear UI
-            for item in self.exam_tree.get_children():
-                self.exam_tree.delete(item)
+            self.exam_tree.set_rows([])
 
             self.exam_name_var.set("")
             self.exam_date_var.set("")
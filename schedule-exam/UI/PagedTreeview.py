@@ -0,0 +1,106 @@
+import tkinter as tk
+from tkinter import ttk
+
+
+class PagedTreeview(ttk.Frame):
+    # Treeview over a plain list of row tuples that only materializes one page of rows at a time. Sorting
+    # (click a heading, again to reverse) and filtering reorder a list of row indices and redraw the current
+    # page, so neither touches more than page_size widget items however many rows there are.
+
+    def __init__(self, parent, columns, widths=None, page_size=200, height=10):
+        super().__init__(parent)
+        self.columns = tuple(columns)
+        self.page_size = page_size
+        self.rows = []
+        self.view = []
+        self.page = 0
+        self.filters = {}
+        self.sort_column = None
+        self.sort_reverse = False
+
+        table = ttk.Frame(self)
+        table.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(table, columns=self.columns, show="headings", height=height)
+        for col in self.columns:
+            self.tree.heading(col, text=col, command=lambda c=col: self.sort_by(c))
+            self.tree.column(col, width=(widths or {}).get(col, 100))
+        scrollbar = ttk.Scrollbar(table, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        nav = ttk.Frame(self)
+        nav.pack(fill=tk.X)
+        ttk.Button(nav, text="< Prev", command=lambda: self.show_page(self.page - 1)).pack(side=tk.LEFT)
+        ttk.Button(nav, text="Next >", command=lambda: self.show_page(self.page + 1)).pack(side=tk.LEFT)
+        self.page_var = tk.StringVar()
+        ttk.Label(nav, textvariable=self.page_var).pack(side=tk.LEFT, padx=10)
+        self.update_page_label()
+
+    def set_rows(self, rows):
+        self.rows = list(rows)
+        self.refresh()
+
+    def append_rows(self, rows):
+        # New rows only cost a redraw when they are visible on the current page
+        start = len(self.rows)
+        self.rows.extend(rows)
+        if self.filters or self.sort_column is not None:
+            self.refresh(keep_page=True)
+            return
+        self.view.extend(range(start, len(self.rows)))
+        if len(self.view) - (len(self.rows) - start) < (self.page + 1) * self.page_size:
+            self.show_page(self.page)
+        else:
+            self.update_page_label()
+
+    def set_filter(self, column, value, exact=False):
+        # Keep rows whose column equals value (a case-insensitive substring match for text unless exact);
+        # '' or None clears the filter
+        if value in ('', None):
+            self.filters.pop(column, None)
+        else:
+            self.filters[column] = value, exact
+        self.refresh()
+
+    def sort_by(self, column):
+        self.sort_reverse = self.sort_column == column and not self.sort_reverse
+        self.sort_column = column
+        self.refresh()
+
+    def refresh(self, keep_page=False):
+        filters = [(self.columns.index(col), value, exact) for col, (value, exact) in self.filters.items()]
+        self.view = [i for i, row in enumerate(self.rows)
+                     if all(matches(row[c], value, exact) for c, value, exact in filters)]
+        if self.sort_column is not None:
+            c = self.columns.index(self.sort_column)
+            self.view.sort(key=lambda i: sort_key(self.rows[i][c]), reverse=self.sort_reverse)
+        self.show_page(self.page if keep_page else 0)
+
+    def show_page(self, page):
+        last_page = max((len(self.view) - 1) // self.page_size, 0)
+        self.page = min(max(page, 0), last_page)
+        self.tree.delete(*self.tree.get_children())
+        start = self.page * self.page_size
+        for i in self.view[start:start + self.page_size]:
+            self.tree.insert("", tk.END, values=self.rows[i])
+        self.update_page_label()
+
+    def update_page_label(self):
+        start = self.page * self.page_size
+        shown = min(start + self.page_size, len(self.view))
+        filtered = f" (filtered from {len(self.rows)})" if len(self.view) != len(self.rows) else ""
+        self.page_var.set(f"Rows {start + 1 if shown else 0}-{shown} of {len(self.view)}{filtered}")
+
+
+def matches(cell, value, exact=False):
+    if isinstance(value, str) and not exact:
+        return value.casefold() in str(cell).casefold()
+    return cell == value
+
+
+def sort_key(cell):
+    # Numbers before text, numbers by value, text case-insensitively
+    if isinstance(cell, (int, float)):
+        return 0, cell, ""
+    return 1, 0, str(cell).casefold()
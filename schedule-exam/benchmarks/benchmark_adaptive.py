@@ -0,0 +1,47 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BusinessLogic.GeneticAlgorithm import GeneticAlgorithm
+from synthetic import generate_session
+
+# A small session that stagnates early and a big one that converges slowly
+SESSIONS = [('small', dict(n_exams=60, n_teachers=40, n_weeks=2), 200),
+            ('big', dict(n_exams=300, n_teachers=277, n_weeks=3), 100)]
+SEEDS = [2, 3, 4]
+
+
+def run(teachers, exams, adaptive, generations, seed):
+    ga = GeneticAlgorithm(teachers, exams, population_size=50, generations=generations, seed=seed,
+                          adaptive=adaptive)
+    _, report = ga.evolve(progress_callback=None, return_report=True)
+    return report
+
+
+def main():
+    for label, size, generations in SESSIONS:
+        teachers, exams = generate_session(**size)
+
+        # Target: what a fixed-parameter run reaches by the end, so both settings have something to catch up with
+        target = run(teachers, exams, False, generations, seed=1)['best_fitness']
+        print(f"{label} session: target fitness {target:.2f} (fixed parameters, best after {generations} generations)")
+
+        print(f"{'adaptive':>9} {'seed':>5} {'to target':>10} {'wall time (s)':>14} {'best':>10}  final settings")
+        for adaptive in (False, True):
+            for seed in SEEDS:
+                report = run(teachers, exams, adaptive, generations, seed)
+                history = report['best_fitness_history']
+                reached = next((g + 1 for g, best in enumerate(history) if best >= target), f">{generations}")
+                settings = ""
+                if report['adaptive'] is not None:
+                    mix = ", ".join(f"{name} {op['probability']:.2f}"
+                                    for name, op in report['adaptive']['operators'].items())
+                    settings = (f"rate {report['adaptive']['mutation_rate']:.3f}, "
+                                f"tournament {report['adaptive']['tournament_size']}, {mix}")
+                print(f"{str(adaptive):>9} {seed:>5} {reached:>10} {report['elapsed']:>14.2f} "
+                      f"{report['best_fitness']:>10.2f}  {settings}")
+
+
+if __name__ == "__main__":
+    main()
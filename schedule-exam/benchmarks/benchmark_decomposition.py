@@ -0,0 +1,30 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BusinessLogic.Solvers import create_solver
+from synthetic import generate_session
+
+EXAMS_PER_WEEK = 150
+WEEKS = [1, 2, 4, 8]
+
+
+def main():
+    workers = os.cpu_count() or 1
+    print(f"{'weeks':>6} {'exams':>6} {'genetic (s)':>12} {'fitness':>9} "
+          f"{'weekly (s)':>11} {'fitness':>9} {f'weekly x{workers} (s)':>16}")
+    for n_weeks in WEEKS:
+        teachers, exams = generate_session(EXAMS_PER_WEEK * n_weeks, 300, n_weeks=n_weeks)
+        results = []
+        for name, options in (('genetic', {}), ('weekly', {}), ('weekly', {'workers': workers})):
+            solver = create_solver(name, teachers, exams, seed=1, generations=30, **options)
+            _, report = solver.solve(progress_callback=None)
+            results.append(report)
+        genetic, weekly, parallel = results
+        print(f"{n_weeks:>6} {len(exams):>6} {genetic['elapsed']:>12.2f} {genetic['best_fitness']:>9.2f} "
+              f"{weekly['elapsed']:>11.2f} {weekly['best_fitness']:>9.2f} {parallel['elapsed']:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
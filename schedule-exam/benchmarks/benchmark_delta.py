@@ -0,0 +1,41 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BusinessLogic.FitnessState import FitnessState
+from BusinessLogic.GeneticAlgorithm import GeneticAlgorithm
+from synthetic import generate_session
+
+
+def time_children(ga, population, incremental, count=200):
+    states = [FitnessState(ga.problem, chrom) for chrom in population]
+    start = time.perf_counter()
+    for i in range(count):
+        if incremental:
+            state = states[i % len(population)].copy()
+            ga.mutate(population[i % len(population)].copy(), state)
+            state.score()
+        else:
+            child = ga.mutate(population[i % len(population)].copy())
+            ga.fitness_batch(child[None])
+    return (time.perf_counter() - start) / count * 1000
+
+
+def main():
+    print(f"{'exams':>6} {'teachers':>9} {'full rescore (ms/child)':>24} {'delta (ms/child)':>17}")
+    for n_exams, n_teachers in ((50, 30), (300, 277), (1000, 500), (5000, 2000)):
+        teachers, exams = generate_session(n_exams=n_exams, n_teachers=n_teachers, n_weeks=4)
+        ga = GeneticAlgorithm(teachers, exams, population_size=20, mutation_rate=0.3, seed=7)
+        population = ga.create_initial_population()
+
+        # Mutation-only children touching a handful of exams
+        ga.mutation_rate = 3 / n_exams
+        full_time = time_children(ga, population, incremental=False)
+        delta_time = time_children(ga, population, incremental=True)
+        print(f"{n_exams:>6} {n_teachers:>9} {full_time:>24.3f} {delta_time:>17.3f}")
+
+
+if __name__ == "__main__":
+    main()
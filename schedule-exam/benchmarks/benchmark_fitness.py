@@ -0,0 +1,47 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BusinessLogic.GeneticAlgorithm import EMPTY_SLOT, GeneticAlgorithm
+from synthetic import generate_session
+
+
+def time_call(func, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def random_population(ga, population_size, rng):
+    # Random encoded chromosomes, with some slots left empty to exercise the understaffing penalty
+    shape = (population_size, len(ga.exams), ga.slots)
+    population = rng.integers(0, len(ga.teachers), size=shape, dtype=np.int32)
+    population[rng.random(shape) < 0.2] = EMPTY_SLOT
+    return population
+
+
+def main():
+    teachers, exams = generate_session(n_exams=300, n_teachers=277, n_weeks=3)
+    rng = np.random.default_rng(0)
+
+    print(f"{'population':>10} {'fitness (s)':>12} {'fitness_batch (s)':>18} {'speedup':>8}")
+    for population_size in (10, 50, 200, 1000):
+        ga = GeneticAlgorithm(teachers, exams, population_size=population_size, seed=0)
+        population = random_population(ga, population_size, rng)
+
+        loop_time, loop_scores = time_call(lambda: [ga.fitness(chrom) for chrom in population])
+        batch_time, batch_scores = time_call(lambda: ga.fitness_batch(population))
+        assert np.allclose(loop_scores, batch_scores)
+
+        print(f"{population_size:>10} {loop_time:>12.4f} {batch_time:>18.4f} {loop_time / batch_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
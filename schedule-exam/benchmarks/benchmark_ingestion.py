@@ -0,0 +1,98 @@
+import datetime
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from DataAccess import DataLoader
+
+
+def write_exams_csv(filename, rows, seed=0):
+    # Semicolon-separated, Windows-1252 encoded: the layout Excel produces on French locales
+    rng = random.Random(seed)
+    start = datetime.date(2025, 1, 6)
+    with open(filename, 'w', encoding='cp1252', newline='') as f:
+        f.write("name;date;time;duration;supervisors_needed\n")
+        for i in range(rows):
+            date = start + datetime.timedelta(days=rng.randrange(28))
+            f.write(f"Épreuve {i};{date:%Y-%m-%d};{rng.choice(['08:00', '10:30', '14:00'])};"
+                    f"{rng.choice([1.5, 2, 3])};{rng.randint(1, 4)}\n")
+
+
+def write_teachers_csv(filename, rows, seed=0):
+    rng = random.Random(seed)
+    with open(filename, 'w', encoding='cp1252', newline='') as f:
+        f.write("Nom Et Prénom Enseignant,Département,Grade,Cours,TD,TP,coef,Nombre de Séances de surveillance\n")
+        for i in range(rows):
+            f.write(f"Enseignant {i},{rng.randint(1, 5)}-GÉNIE,Maître Assistant,{rng.choice([0, 1.5, 3])},"
+                    f"{rng.choice([0, 0.75])},0,0,{rng.randint(0, 15)}\n")
+
+
+def legacy_read_exams(filename):
+    # The ingestion path ExamSchedulerApp.import_exams_csv used before the DataLoader rewrite
+    for encoding in ['utf-8', 'latin1', 'cp1252', 'iso-8859-1', 'utf-8-sig']:
+        for delimiter in [',', ';', '\t']:
+            try:
+                exams_data = pd.read_csv(filename, sep=delimiter, encoding=encoding)
+                if not all(col in exams_data.columns for col in DataLoader.EXAM_COLUMNS):
+                    continue
+                exams = []
+                for _, row in exams_data.iterrows():
+                    try:
+                        exams.append(DataLoader.create_exam(len(exams), str(row['name']).strip(),
+                                                            str(row['date']).strip(), str(row['time']).strip(),
+                                                            row['duration'], row['supervisors_needed']))
+                    except ValueError:
+                        continue
+                return exams
+            except Exception:
+                continue
+
+
+def legacy_read_teachers(filename):
+    # The path ExamSchedulerApp.import_csv + prepare_teachers_data used: full-file read, python engine, iterrows
+    with open(filename, 'rb') as f:
+        f.read()
+    teachers_data = DataLoader.normalize_teachers_data(pd.read_csv(filename, sep=',', encoding='cp1252',
+                                                                   engine='python'))
+    return [{'id': idx, 'name': row['Nom Et Prénom'], 'department': row['Département'], 'grade': row['Grade'],
+             'supervision_capacity': int(row['Nombre de Séances de surveillance'])}
+            for idx, row in teachers_data.iterrows()]
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    print(f"{'rows':>7} {'exams legacy (s)':>17} {'exams new (s)':>14} "
+          f"{'teachers legacy (s)':>20} {'teachers new (s)':>17}")
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in (10_000, 50_000, 100_000):
+            exams_file = os.path.join(directory, f"exams_{rows}.csv")
+            teachers_file = os.path.join(directory, f"teachers_{rows}.csv")
+            write_exams_csv(exams_file, rows)
+            write_teachers_csv(teachers_file, rows)
+
+            legacy_exams_time, legacy_exams = timed(lambda: legacy_read_exams(exams_file))
+            exams_time, (exams, errors) = timed(lambda: DataLoader.read_exams_csv(exams_file))
+            assert not errors and exams == legacy_exams
+
+            legacy_teachers_time, legacy_teachers = timed(lambda: legacy_read_teachers(teachers_file))
+            teachers_time, teachers = timed(
+                lambda: DataLoader.prepare_teachers(DataLoader.read_teachers_csv(teachers_file)))
+            assert teachers == legacy_teachers
+
+            print(f"{rows:>7} {legacy_exams_time:>17.2f} {exams_time:>14.2f} "
+                  f"{legacy_teachers_time:>20.2f} {teachers_time:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BusinessLogic.IslandModel import TOPOLOGIES, IslandModel
+from synthetic import generate_session
+
+
+def main():
+    teachers, exams = generate_session(n_exams=1000, n_teachers=500, n_weeks=4)
+    island_counts = [1, 2] + [n for n in (4, 8, 16) if n <= (os.cpu_count() or 1)]
+
+    # Every island runs a full population, so more islands search more of the space in the same wall time as
+    # long as there is a core per island
+    print(f"{'islands':>8} {'topology':>18} {'best fitness':>13} {'time (s)':>9}")
+    for islands in island_counts:
+        for topology in TOPOLOGIES if islands > 2 else TOPOLOGIES[:1]:
+            model = IslandModel(teachers, exams, islands=islands, topology=topology, generations=30, seed=42)
+            _, report = model.solve(progress_callback=None)
+            print(f"{islands:>8} {topology:>18} {report['best_fitness']:>13.2f} {report['elapsed']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BusinessLogic.GeneticAlgorithm import GeneticAlgorithm
+from synthetic import generate_session
+
+
+def run(teachers, exams, **options):
+    ga = GeneticAlgorithm(teachers, exams, population_size=50, seed=1, **options)
+    _, report = ga.evolve(progress_callback=None, return_report=True)
+    return report
+
+
+def main():
+    teachers, exams = generate_session(n_exams=300, n_teachers=277, n_weeks=3)
+
+    # Local search with a fixed time budget, then the GA given that same time as extra generations
+    polished = run(teachers, exams, generations=30, polish_count=3, polish_iterations=100000, polish_time=1.0)
+    baseline = run(teachers, exams, generations=30)
+    per_generation = baseline['elapsed'] / baseline['generations']
+    extra = run(teachers, exams, generations=30 + int(round((polished['elapsed'] - baseline['elapsed']) /
+                                                            per_generation)))
+
+    print(f"{'run':>32} {'generations':>12} {'time (s)':>9} {'best fitness':>13}")
+    for name, report in (("GA", baseline), ("GA + local search", polished), ("GA, same time as extra gens", extra)):
+        print(f"{name:>32} {report['generations']:>12} {report['elapsed']:>9.2f} {report['best_fitness']:>13.2f}")
+    print(f"local search moves: {polished['polish']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BusinessLogic.GeneticAlgorithm import GeneticAlgorithm
+from synthetic import generate_session
+
+SEED_FRACTIONS = [0.0, 0.1, 0.25, 0.5]
+
+
+def run(teachers, exams, seed_fraction, target_fitness, generations, seed):
+    ga = GeneticAlgorithm(teachers, exams, population_size=50, generations=generations, seed=seed,
+                          seed_fraction=seed_fraction, target_fitness=target_fitness)
+    _, report = ga.evolve(progress_callback=None, return_report=True)
+    return report
+
+
+def main():
+    teachers, exams = generate_session(n_exams=300, n_teachers=277, n_weeks=3)
+    generations = 200
+
+    # Target: what an unseeded run reaches by the end, so every setting has something to catch up with
+    target = run(teachers, exams, 0.0, None, generations, seed=1)['best_fitness']
+    print(f"target fitness {target:.2f} (unseeded best after {generations} generations)")
+
+    print(f"{'seed fraction':>14} {'initial best':>13} {'generations':>12} {'wall time (s)':>14} {'best':>10}")
+    for seed_fraction in SEED_FRACTIONS:
+        report = run(teachers, exams, seed_fraction, target, generations, seed=2)
+        reached = report['generations'] if report['stop_reason'] == 'target_fitness' else f">{generations}"
+        print(f"{seed_fraction:>14} {report['best_fitness_history'][0]:>13.2f} {reached:>12} "
+              f"{report['elapsed']:>14.2f} {report['best_fitness']:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
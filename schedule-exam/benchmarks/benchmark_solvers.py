@@ -0,0 +1,27 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BusinessLogic.Solvers import SOLVERS, create_solver
+from synthetic import generate_session
+
+# (exams, teachers, max supervisors per exam, weeks, teacher capacity range)
+INSTANCES = [(100, 200, 3, 2, (1, 6)), (300, 277, 3, 3, (1, 6)), (300, 150, 3, 3, (0, 3)),
+             (1000, 500, 4, 4, (1, 6))]
+
+
+def main():
+    print(f"{'instance':>28} {'solver':>8} {'best fitness':>13} {'time (s)':>9}")
+    for n_exams, n_teachers, max_supervisors, n_weeks, capacity_range in INSTANCES:
+        teachers, exams = generate_session(n_exams, n_teachers, max_supervisors=max_supervisors, n_weeks=n_weeks,
+                                           capacity_range=capacity_range)
+        name = f"{n_exams}x{n_teachers} cap {capacity_range[0]}-{capacity_range[1]}"
+        for solver_name in SOLVERS:
+            solver = create_solver(solver_name, teachers, exams, seed=1, generations=100)
+            _, report = solver.solve(progress_callback=None)
+            print(f"{name:>28} {solver_name:>8} {report['best_fitness']:>13.2f} {report['elapsed']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
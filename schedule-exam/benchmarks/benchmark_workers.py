@@ -0,0 +1,43 @@
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BusinessLogic.GeneticAlgorithm import GeneticAlgorithm
+from synthetic import generate_session
+
+
+def run(teachers, exams, workers, parallel_offspring):
+    ga = GeneticAlgorithm(teachers, exams, population_size=200, generations=10, seed=42,
+                          workers=workers, parallel_offspring=parallel_offspring)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        solution = ga.evolve()
+    return time.perf_counter() - start, solution
+
+
+def main():
+    teachers, exams = generate_session(n_exams=1000, n_teachers=500, n_weeks=4)
+    worker_counts = [1, 2] + [n for n in (4, 8, 16, 32) if n <= (os.cpu_count() or 1)]
+
+    print(f"{'workers':>8} {'evaluation only (s)':>20} {'+ offspring (s)':>16}")
+    reference = {}
+    for workers in worker_counts:
+        eval_time, eval_solution = run(teachers, exams, workers, parallel_offspring=False)
+        full_time, full_solution = run(teachers, exams, workers, parallel_offspring=True)
+
+        # Seeded runs must not depend on the number of workers
+        reference.setdefault('evaluation', eval_solution)
+        if workers > 1:
+            reference.setdefault('offspring', full_solution)
+            assert full_solution == reference['offspring']
+        assert eval_solution == reference['evaluation']
+
+        print(f"{workers:>8} {eval_time:>20.2f} {full_time:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
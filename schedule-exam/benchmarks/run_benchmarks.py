@@ -0,0 +1,168 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from BusinessLogic.GeneticAlgorithm import GeneticAlgorithm
+from synthetic import generate_session
+
+# (exams, teachers, max supervisors per exam, weeks)
+PROFILES = {
+    'quick': [(10, 50, 3, 1), (100, 200, 3, 2), (300, 277, 3, 3)],
+    'full': [(10, 50, 3, 1), (100, 200, 3, 2), (300, 277, 3, 3), (1000, 500, 4, 4),
+             (2000, 1000, 4, 6), (5000, 2000, 5, 8)]
+}
+
+
+def best_time(func, repeat, number=1):
+    # Best of `repeat` runs, each averaging `number` calls
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def peak_memory(func):
+    # Peak traced allocation (Python objects and NumPy buffers) while func runs, in bytes
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_scenario(n_exams, n_teachers, max_supervisors, n_weeks, population_size, generations, repeat, seed):
+    teachers, exams = generate_session(n_exams, n_teachers, max_supervisors=max_supervisors, n_weeks=n_weeks,
+                                       seed=seed)
+
+    def make_ga():
+        return GeneticAlgorithm(teachers, exams, population_size=population_size, generations=generations,
+                                seed=seed)
+
+    ga = make_ga()
+    population = ga.create_initial_population()
+    fitness_scores = ga.fitness_batch(population)
+    parents = ga.select_parents(population, fitness_scores)
+
+    def evolve():
+        with contextlib.redirect_stdout(io.StringIO()):
+            make_ga().evolve(progress_callback=None)
+
+    # Per-phase timings; single-chromosome operators are timed per call
+    phases = {
+        'setup': best_time(make_ga, repeat),
+        'create_initial_population': best_time(ga.create_initial_population, repeat),
+        'fitness': best_time(lambda: ga.fitness(population[0]), repeat, number=10),
+        'fitness_batch': best_time(lambda: ga.fitness_batch(population), repeat),
+        'select_parents': best_time(lambda: ga.select_parents(population, fitness_scores), repeat, number=10),
+        'crossover': best_time(lambda: ga.crossover(parents[0], parents[1]), repeat, number=100),
+        'mutate': best_time(lambda: ga.mutate(parents[0].copy()), repeat, number=20),
+        'create_offspring': best_time(lambda: ga.create_offspring(parents, population_size - ga.elite_size), repeat),
+        'evolve': best_time(evolve, 1)
+    }
+
+    return {
+        'scenario': f"{n_exams}x{n_teachers}x{max_supervisors}x{n_weeks}",
+        'exams': n_exams,
+        'teachers': n_teachers,
+        'max_supervisors': max_supervisors,
+        'weeks': n_weeks,
+        'population_size': population_size,
+        'generations': generations,
+        'seconds': phases,
+        'peak_memory_bytes': {
+            'create_initial_population': peak_memory(ga.create_initial_population),
+            'evolve': peak_memory(evolve)
+        }
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, current, threshold):
+    # Print per-phase ratios against a previous results file; returns the regressions beyond threshold
+    previous = {result['scenario']: result for result in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        if result['scenario'] not in previous:
+            continue
+        for phase, seconds in result['seconds'].items():
+            before = previous[result['scenario']]['seconds'].get(phase)
+            if not before:
+                continue
+            ratio = seconds / before
+            flag = ''
+            if ratio > 1 + threshold:
+                flag = '  REGRESSION'
+                regressions.append((result['scenario'], phase, ratio))
+            print(f"{result['scenario']:>18} {phase:>26} {before:>10.4f}s -> {seconds:>10.4f}s {ratio:>6.2f}x{flag}")
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Time GeneticAlgorithm phases on synthetic exam sessions.")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='quick')
+    parser.add_argument('--population-size', type=int, default=50)
+    parser.add_argument('--generations', type=int, default=10, help="generations for the whole-evolve timing")
+    parser.add_argument('--repeat', type=int, default=3, help="repetitions per phase (best time is kept)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', help="write results as JSON to this file")
+    parser.add_argument('--compare', help="previous JSON results to compare against")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="relative slowdown reported as a regression (default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    results = {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'profile': args.profile,
+        'results': []
+    }
+    for scenario in PROFILES[args.profile]:
+        result = run_scenario(*scenario, population_size=args.population_size, generations=args.generations,
+                              repeat=args.repeat, seed=args.seed)
+        results['results'].append(result)
+        timings = ', '.join(f"{phase} {seconds:.4f}s" for phase, seconds in result['seconds'].items())
+        print(f"{result['scenario']}: {timings}, "
+              f"peak {result['peak_memory_bytes']['evolve'] / 2 ** 20:.1f} MiB", flush=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,37 @@
+import datetime
+import random
+
+# Exam start times, as hours after 08:00
+EXAM_SLOTS = [0, 2, 5, 7]
+
+
+def generate_session(n_exams, n_teachers, max_supervisors=3, n_weeks=2, seed=0, min_supervisors=1,
+                     capacity_range=(1, 6)):
+    # Build teacher and exam dicts shaped like the ones ExamSchedulerApp hands to GeneticAlgorithm.
+    # The same arguments always produce the same session.
+    rng = random.Random(seed)
+    start = datetime.datetime(2025, 1, 6, 8, 0)  # a Monday
+
+    teachers = [{
+        'id': i,
+        'name': f"Enseignant {i + 1}",
+        'department': f"{rng.randint(1, 5)}-DEPARTEMENT",
+        'grade': 'Maître Assistant',
+        'supervision_capacity': rng.randint(*capacity_range)
+    } for i in range(n_teachers)]
+
+    exams = []
+    for i in range(n_exams):
+        # Exams are held Monday to Saturday
+        day = rng.randrange(n_weeks) * 7 + rng.randrange(6)
+        hour = rng.choice(EXAM_SLOTS)
+        exams.append({
+            'id': i,
+            'name': f"Exam {i + 1}",
+            'date': start + datetime.timedelta(days=day, hours=hour),
+            'duration': rng.choice([1.5, 2, 3]),
+            'supervisors_needed': rng.randint(min_supervisors, max_supervisors),
+            'assigned_teachers': []
+        })
+
+    return teachers, exams
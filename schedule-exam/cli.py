@@ -0,0 +1,168 @@
+import argparse
+import sys
+
+from BusinessLogic.Checkpoint import CheckpointError
+from BusinessLogic.GeneticAlgorithm import MUTATION_OPERATORS, print_progress
+from BusinessLogic.Instrumentation import Instrumentation, exporter_for
+from BusinessLogic.IslandModel import TOPOLOGIES
+from BusinessLogic.Reoptimizer import Reoptimizer
+from BusinessLogic.Solvers import SOLVERS, create_solver
+from DataAccess import DataLoader, ScheduleExporter
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Assign exam supervisors without the GUI and export the schedule.")
+    parser.add_argument('teachers', help="teachers CSV file")
+    parser.add_argument('exams', help="exams CSV file (name, date, time, duration, supervisors_needed)")
+    parser.add_argument('-o', '--output', default='schedule.csv', help="output file (default: %(default)s)")
+    parser.add_argument('--format', choices=ScheduleExporter.EXPORT_FORMATS, default=None,
+                        help="output format (default: from the output extension, otherwise csv); "
+                             "timetable is one row per teacher and one column per exam time")
+
+    parser.add_argument('--solver', choices=SOLVERS, default='genetic',
+                        help="genetic algorithm, exact flow solver, flow solution refined by the GA, one GA "
+                             "per ISO week, or GA populations in parallel processes (default: %(default)s)")
+
+    reopt_group = parser.add_argument_group("re-optimization")
+    reopt_group.add_argument('--previous', help="published schedule CSV to repair instead of solving from scratch")
+    reopt_group.add_argument('--unavailable', action='append', default=[], metavar='TEACHER',
+                             help="name of a teacher who can no longer supervise (repeatable)")
+    reopt_group.add_argument('--churn-penalty', type=float, default=10,
+                             help="fitness cost of each published assignment that is changed (default: %(default)s)")
+
+    ga_group = parser.add_argument_group("genetic algorithm")
+    ga_group.add_argument('--population-size', type=int, default=50)
+    ga_group.add_argument('--generations', type=int, default=100)
+    ga_group.add_argument('--mutation-rate', type=float, default=0.1)
+    ga_group.add_argument('--elite-size', type=int, default=5)
+    ga_group.add_argument('--tournament-size', type=int, default=3)
+    ga_group.add_argument('--adaptive', action='store_true',
+                          help="retune the mutation rate, tournament size and mutation operator mix during the run")
+    ga_group.add_argument('--mutation-operators', nargs='+', choices=MUTATION_OPERATORS, default=None,
+                          help="mutation operators to use (default: all with --adaptive, otherwise add_remove)")
+    ga_group.add_argument('--seed', type=int, default=None, help="random seed for reproducible runs")
+    ga_group.add_argument('--workers', type=int, default=1, help="processes used for fitness evaluation")
+    ga_group.add_argument('--seed-fraction', type=float, default=0.0,
+                          help="fraction of the initial population built greedily (default: %(default)s)")
+    ga_group.add_argument('--polish', type=int, default=0,
+                          help="run local search on this many of the best final chromosomes")
+    ga_group.add_argument('--polish-time', type=float, default=None, help="seconds allowed for local search")
+    ga_group.add_argument('--stagnation', type=int, default=None,
+                          help="stop after this many generations without improvement")
+    ga_group.add_argument('--target-fitness', type=float, default=None, help="stop once this fitness is reached")
+    ga_group.add_argument('--time-budget', type=float, default=None, help="stop after this many seconds")
+    ga_group.add_argument('--checkpoint', help="save the run state to this file so it can be resumed")
+    ga_group.add_argument('--checkpoint-every', type=int, default=10,
+                          help="generations between checkpoints; one is also saved when the run ends "
+                               "(default: %(default)s)")
+    ga_group.add_argument('--resume', help="continue the run saved in this checkpoint file; other options may "
+                                           "differ from the saved run's to fork it")
+
+    island_group = parser.add_argument_group("island model (--solver island)")
+    island_group.add_argument('--islands', type=int, default=4,
+                              help="populations, one process each (default: %(default)s)")
+    island_group.add_argument('--migration-interval', type=int, default=10,
+                              help="generations between migrations, 0 to never migrate (default: %(default)s)")
+    island_group.add_argument('--migration-size', type=int, default=2,
+                              help="best chromosomes each island sends per migration (default: %(default)s)")
+    island_group.add_argument('--topology', choices=TOPOLOGIES, default='ring',
+                              help="islands receiving each island's migrants (default: %(default)s)")
+
+    parser.add_argument('--metrics', help="write per-generation metrics to this file (.csv, otherwise JSON lines)")
+    parser.add_argument('-q', '--quiet', action='store_true', help="don't print per-generation progress")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    try:
+        teachers = DataLoader.prepare_teachers(DataLoader.read_teachers_csv(args.teachers))
+        exams, errors = DataLoader.read_exams_csv(args.exams)
+    except (OSError, ValueError) as e:
+        print(f"Import error: {e}", file=sys.stderr)
+        return 1
+
+    if errors:
+        print(f"Skipped {len(errors)} invalid exam rows:\n{DataLoader.format_errors(errors)}", file=sys.stderr)
+
+    if not exams:
+        print("No exams to schedule", file=sys.stderr)
+        return 1
+
+    instrumentation = None
+    exporter = None
+    if args.metrics:
+        instrumentation = Instrumentation()
+        exporter = instrumentation.subscribe(exporter_for(args.metrics))
+
+    if args.previous:
+        if args.checkpoint or args.resume:
+            print("Error: re-optimization doesn't support checkpoints", file=sys.stderr)
+            return 1
+        try:
+            previous = ScheduleExporter.read_schedule_csv(args.previous, exams, teachers)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error reading previous schedule: {e}", file=sys.stderr)
+            return 1
+        unavailable = [t['id'] for t in teachers if t['name'] in set(args.unavailable)]
+        solver = Reoptimizer(teachers, exams, previous, unavailable=unavailable, churn_penalty=args.churn_penalty,
+                             time_budget=args.time_budget, seed=args.seed)
+    else:
+        try:
+            solver = create_solver(args.solver, teachers, exams,
+                                   population_size=args.population_size,
+                                   generations=args.generations,
+                                   mutation_rate=args.mutation_rate,
+                                   elite_size=args.elite_size,
+                                   tournament_size=args.tournament_size,
+                                   adaptive=args.adaptive,
+                                   mutation_operators=args.mutation_operators,
+                                   seed=args.seed,
+                                   workers=args.workers,
+                                   seed_fraction=args.seed_fraction,
+                                   polish_count=args.polish,
+                                   polish_time=args.polish_time,
+                                   stagnation_generations=args.stagnation,
+                                   target_fitness=args.target_fitness,
+                                   time_budget=args.time_budget,
+                                   checkpoint_path=args.checkpoint,
+                                   checkpoint_every=args.checkpoint_every,
+                                   resume_from=args.resume,
+                                   islands=args.islands,
+                                   migration_interval=args.migration_interval,
+                                   migration_size=args.migration_size,
+                                   topology=args.topology,
+                                   instrumentation=instrumentation)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 1
+    try:
+        solution, report = solver.solve(progress_callback=None if args.quiet else print_progress)
+    except CheckpointError as e:
+        print(f"Checkpoint error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if exporter is not None:
+            exporter.close()
+
+    ScheduleExporter.apply_solution(exams, solution)
+    try:
+        ScheduleExporter.export_schedule(args.output, exams, teachers, args.format)
+    except (OSError, ValueError) as e:
+        print(f"Export error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Scheduled {len(exams)} exams with {len(teachers)} teachers using the {report['solver']} solver "
+          f"in {report['generations']} generations "
+          f"({report['elapsed']:.1f}s, stopped by {report['stop_reason']}), best fitness {report['best_fitness']:.2f}")
+    if report['solver'] == 'reoptimize':
+        print(f"Re-optimized {report['movable_exams']} of {len(exams)} exams, "
+              f"{report['changed_assignments']} published assignments changed")
+    print(f"Schedule exported to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
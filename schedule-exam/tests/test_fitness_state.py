@@ -0,0 +1,56 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+from BusinessLogic.FitnessState import FitnessState, count_conflicts
+from BusinessLogic.GeneticAlgorithm import MUTATION_OPERATORS, GeneticAlgorithm
+from synthetic import generate_session
+
+
+@pytest.fixture(scope='module')
+def session():
+    # Small and tight: overlapping exams and low capacities, so every penalty term moves
+    return generate_session(n_exams=40, n_teachers=15, n_weeks=2, capacity_range=(0, 3), seed=1)
+
+
+@pytest.mark.parametrize('operator', MUTATION_OPERATORS)
+def test_delta_score_matches_full_rescore(session, operator):
+    # Chains of crossover, mutation and repair on states updated in place must score like a full rescan.
+    # Every other step crosses with a near-copy of the first parent, as in a converged population, so both
+    # the delta and the rebuild branch of crossover run.
+    teachers, exams = session
+    ga = GeneticAlgorithm(teachers, exams, population_size=12, mutation_rate=0.3, seed=3,
+                          mutation_operators=(operator,))
+    population = ga.create_initial_population()
+    states = [FitnessState(ga.problem, chrom) for chrom in population]
+
+    for step in range(60):
+        first, second = ga.draw_pairs(len(population), 1)[0]
+        other = population[second] if step % 2 else ga.mutate(population[first].copy())
+
+        state = states[first].copy()
+        child = ga.mutate(ga.crossover(population[first], other, state), state)
+        if step % 3 == 0:
+            ga.repair(child, state)
+
+        assert state.conflicts == count_conflicts(ga.problem, child)
+        assert np.isclose(state.score(), ga.fitness(child))
+        assert np.isclose(state.score(), ga.fitness_batch(child[None])[0])
+        population[first], states[first] = child, state
+
+
+def test_copy_is_independent(session):
+    teachers, exams = session
+    ga = GeneticAlgorithm(teachers, exams, population_size=2, seed=0)
+    chromosome = ga.create_initial_population()[0]
+    state = FitnessState(ga.problem, chromosome)
+    score = state.score()
+
+    ga.mutate(chromosome.copy(), state.copy(), mutated=np.ones(len(exams), dtype=bool))
+    assert state.score() == score